@@ -0,0 +1,32 @@
+import vocaAPI from "../api";
+
+// Fetches the sentences of every form shown on the page in one request, the first time
+// any of them is expanded. The other forms are then answered from the same response.
+export class SentenceBatch {
+
+    private key: string | null = null;
+    private request: Promise<any> | null = null;
+
+    public constructor(private readonly forms: () => string[]) {}
+
+    public includes(word: string): boolean {
+        return this.forms().includes(word);
+    }
+
+    public async get(lang: string, word: string, params: any) {
+        const forms = this.forms();
+        const key = JSON.stringify([lang, params, forms]);
+        if (key !== this.key || !this.request) {
+            this.key = key;
+            this.request = vocaAPI.post(`sentences/${lang}/`, {...params, forms});
+        }
+        try {
+            const res = await this.request;
+            return {"data": {"sentences": res.data["sentences"][word] || []}};
+        } catch(e) {
+            // Let the next expanded form retry
+            this.request = null;
+            throw e;
+        }
+    }
+}
@@ -11,3 +11,25 @@ export const noResults = (res) => {
     return res.sentences.every(r => r.sentences.length === 0)
 };
 
+
+const escapeHTML = (text) => {
+    return text
+        .replace(/&/g, "&amp;")
+        .replace(/</g, "&lt;")
+        .replace(/>/g, "&gt;")
+        .replace(/"/g, "&quot;");
+};
+
+// Wraps each [start, end) span of the text in <b>, escaping the rest of it. Offsets
+// count characters (code points) like the API, not UTF-16 units.
+export const highlightSpans = (text, spans) => {
+    const chars = Array.from(text);
+    const part = (start, end?) => escapeHTML(chars.slice(start, end).join(""));
+    let html = "";
+    let last = 0;
+    for (const [start, end] of spans || []) {
+        html += part(last, start) + "<b>" + part(start, end) + "</b>";
+        last = end;
+    }
+    return html + part(last);
+};
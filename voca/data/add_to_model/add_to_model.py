@@ -1,20 +1,151 @@
+import contextlib
+import logging
+import numpy as np
 import pandas as pd
-from sentences.models import Sentence
-
-
-def add(lang, domain, source=None):
-    Sentence.objects.filter(language__exact=lang, category__exact=domain).delete()
-    df_chunks = pd.read_csv("./data/" + lang + "/" + domain + "-sentences-scored.tsv", sep="\t", index_col=0, names=["id", "sentence", "sentence_length", "avg_word_length", "flag"]).sample(300000)
-    for df_chunk in [df_chunks]:
-        sentences = []
-        for index, row in df_chunk.iterrows():
-            if row["sentence_length"] and row["avg_word_length"]:
-                sentences.append(Sentence(
-                    content=row["sentence"],
-                    sentence_length=row["sentence_length"],
-                    avg_word_length=row["avg_word_length"],
-                    source=source,
-                    language=lang,
-                    category=domain
-                ))
-        Sentence.objects.bulk_create(sentences)
+import tqdm
+from django.db import transaction
+from sentences.corpus import activate_generation, collect_garbage_in_background
+from sentences.fields import DifficultyLevel
+from sentences.models import CorpusGeneration, Sentence, SentenceToken
+from sentences.nlp.nlp import difficulty_bucket
+from sentences.utils import format_positions, sentence_tokens
+from . import native
+
+logger = logging.getLogger(__name__)
+
+# Rows read, inserted and committed at once. Memory stays flat whatever the corpus size.
+BATCH_SIZE = 5000
+SAMPLE_SIZE = 300000
+# Imports sample the same rows unless given another seed
+SAMPLE_SEED = 0
+TOKEN_BATCH_SIZE = 10000
+COLUMNS = ["id", "sentence", "sentence_length", "avg_word_length", "flag"]
+
+
+# Loads a new generation of the corpus beside the one being searched, then swaps it in.
+# The previous generation is deleted in the background. loader is "orm" for
+# bulk_create or "native" for COPY / executemany (see native.py).
+# sample_size, seed and balance are described at sampled_batches.
+def add(lang, domain, source=None, sample_size=SAMPLE_SIZE, batch_size=BATCH_SIZE, loader="orm", seed=SAMPLE_SEED,
+        balance=False):
+    insert_sentences, insert_tokens = LOADERS[loader]
+    generation = CorpusGeneration.objects.create(language=lang, category=domain)
+    path = "./data/" + lang + "/" + domain + "-sentences-scored.tsv"
+    if sample_size:
+        df_batches = sampled_batches(path, lang, sample_size, batch_size, seed, balance)
+    else:
+        df_batches = read_batches(path, batch_size)
+    with native.bulk_load() if loader == "native" else contextlib.nullcontext():
+        with tqdm.tqdm(desc=f"{lang} {domain}", unit=" sentences") as progress:
+            for df_batch in df_batches:
+                with transaction.atomic():
+                    insert_sentences(generation, df_batch, source)
+                progress.update(len(df_batch))
+        add_tokens(generation, insert_tokens)
+    activate_generation(generation)
+    collect_garbage_in_background()
+
+
+def bulk_create_sentences(generation, df_batch, source):
+    Sentence.objects.bulk_create([Sentence(
+        content=row.sentence,
+        sentence_length=row.sentence_length,
+        avg_word_length=row.avg_word_length,
+        difficulty=difficulty_bucket(generation.language, row.sentence_length, row.avg_word_length),
+        source=source,
+        language=generation.language,
+        category=generation.category,
+        generation=generation
+    ) for row in df_batch.itertuples()])
+
+
+def bulk_create_tokens(generation, tokens):
+    SentenceToken.objects.bulk_create([
+        SentenceToken(sentence_id=sentence_id, language=generation.language, token=token, positions=positions)
+        for sentence_id, token, positions in tokens])
+
+
+def read_batches(path, batch_size):
+    for df_chunk in pd.read_csv(path, sep="\t", index_col=0, names=COLUMNS, chunksize=batch_size):
+        yield df_chunk[(df_chunk["sentence_length"] != 0) & (df_chunk["avg_word_length"] != 0)]
+
+
+# Random sample of sample_size rows, read in one pass keeping at most about twice the
+# sample in memory. Rows are ranked by a seeded hash of their id and sentence and the
+# lowest ranks kept (bottom-k), so a seed always picks the same rows, in the same random
+# order; seed None draws a random one. With balance, each difficulty level gets an equal
+# share, the share a level has no rows for going to the others; rows of no level, which
+# searches never return, are left out.
+def sampled_batches(path, lang, sample_size, batch_size, seed=SAMPLE_SEED, balance=False):
+    if seed is None:
+        seed = int(np.random.randint(0, 2 ** 31))
+    hash_key = f"{seed:016d}"[-16:]
+    levels = list(DifficultyLevel) if balance else [None]
+    shares = {level: sample_size // len(levels) + (i < sample_size % len(levels)) for i, level in enumerate(levels)}
+    kept = {level: [] for level in levels}
+    kept_rows = dict.fromkeys(levels, 0)
+    thresholds = dict.fromkeys(levels)
+    for df_chunk in read_batches(path, batch_size):
+        df_chunk = df_chunk.assign(sample_key=pd.util.hash_pandas_object(df_chunk["sentence"], hash_key=hash_key))
+        if balance:
+            df_chunk = df_chunk.assign(sample_level=[
+                difficulty_bucket(lang, sentence_length, avg_word_length)
+                for sentence_length, avg_word_length in zip(df_chunk["sentence_length"], df_chunk["avg_word_length"])])
+        for level in levels:
+            df_level = df_chunk if level is None else df_chunk[df_chunk["sample_level"] == level]
+            if thresholds[level] is not None:
+                df_level = df_level[df_level["sample_key"] < thresholds[level]]
+            kept[level].append(df_level)
+            kept_rows[level] += len(df_level)
+            if kept_rows[level] > 2 * shares[level]:
+                df_kept = pd.concat(kept[level]).nsmallest(shares[level], "sample_key")
+                kept[level] = [df_kept]
+                kept_rows[level] = len(df_kept)
+                thresholds[level] = df_kept["sample_key"].max()
+    df_levels = {level: pd.concat(kept[level]) for level in levels}
+    quotas = level_quotas(shares, {level: len(df_level) for level, df_level in df_levels.items()})
+    df_sample = pd.concat([df_levels[level].nsmallest(quotas[level], "sample_key") for level in levels])
+    df_sample = df_sample.sort_values("sample_key").drop(columns=["sample_key", "sample_level"], errors="ignore")
+    for start in range(0, len(df_sample), batch_size):
+        yield df_sample.iloc[start:start + batch_size]
+
+
+# Rows taken from each level: its share, plus what levels with fewer rows than theirs
+# leave over, spread over the levels with rows to spare. Rows past the kept bottom-k of a
+# level were dropped while reading, so a shortfall can remain and is logged.
+def level_quotas(shares, available):
+    quotas = {level: min(share, available[level]) for level, share in shares.items()}
+    shortfall = sum(shares.values()) - sum(quotas.values())
+    while shortfall:
+        spare = [level for level in quotas if available[level] > quotas[level]]
+        if not spare:
+            logger.warning("Sampled %s rows fewer than asked, the difficulty levels have no more.", shortfall)
+            break
+        for level in spare:
+            extra = min(available[level] - quotas[level], -(-shortfall // len(spare)), shortfall)
+            quotas[level] += extra
+            shortfall -= extra
+    return quotas
+
+
+# Fills the SentenceToken index of the sentences of a generation. Ids are read back
+# from the database, bulk_create doesn't set them on every backend.
+def add_tokens(generation, insert_tokens=bulk_create_tokens):
+    sentences = generation.sentences.values_list("id", "content")
+    desc = f"{generation.language} {generation.category} tokens"
+    tokens = []
+    for sentence_id, content in tqdm.tqdm(sentences.iterator(), desc=desc, unit=" sentences"):
+        tokens.extend((sentence_id, token, format_positions(positions))
+                      for token, positions in sentence_tokens(content).items())
+        if len(tokens) >= TOKEN_BATCH_SIZE:
+            with transaction.atomic():
+                insert_tokens(generation, tokens)
+            tokens = []
+    with transaction.atomic():
+        insert_tokens(generation, tokens)
+
+
+LOADERS = {
+    "orm": (bulk_create_sentences, bulk_create_tokens),
+    "native": (native.insert_sentences, native.insert_tokens),
+}
@@ -0,0 +1,80 @@
+import contextlib
+import io
+import uuid
+from django.db import connection
+from sentences.models import Sentence, SentenceToken
+from sentences.nlp.nlp import difficulty_bucket
+
+# Fast path of add_to_model: rows go straight to COPY on PostgreSQL and to one prepared
+# executemany statement elsewhere, without a model instance per row.
+SENTENCE_COLUMNS = ["ref_id", "sentence_length", "avg_word_length", "reports", "language", "content", "source",
+                    "category", "difficulty", "generation_id"]
+TOKEN_COLUMNS = ["sentence_id", "language", "token", "positions"]
+
+
+def insert_sentences(generation, df_batch, source):
+    # UUIDField is a uuid column on PostgreSQL and a char(32) hex string on SQLite
+    new_ref_id = (lambda: str(uuid.uuid4())) if connection.vendor == "postgresql" else (lambda: uuid.uuid4().hex)
+    lang = generation.language
+    rows = [(
+        new_ref_id(),
+        row.sentence_length,
+        row.avg_word_length,
+        0,
+        lang,
+        row.sentence,
+        source,
+        generation.category,
+        difficulty_bucket(lang, row.sentence_length, row.avg_word_length),
+        generation.id
+    ) for row in df_batch.itertuples()]
+    insert_rows(Sentence._meta.db_table, SENTENCE_COLUMNS, rows)
+
+
+def insert_tokens(generation, tokens):
+    rows = [(sentence_id, generation.language, token, positions) for sentence_id, token, positions in tokens]
+    insert_rows(SentenceToken._meta.db_table, TOKEN_COLUMNS, rows)
+
+
+def insert_rows(table, columns, rows):
+    if not rows:
+        return
+    quote_name = connection.ops.quote_name
+    column_list = ", ".join(quote_name(column) for column in columns)
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            data = io.StringIO("".join("\t".join(copy_value(value) for value in row) + "\n" for row in rows))
+            cursor.copy_expert(f"COPY {quote_name(table)} ({column_list}) FROM STDIN", data)
+        else:
+            placeholders = ", ".join(["%s"] * len(columns))
+            cursor.executemany(f"INSERT INTO {quote_name(table)} ({column_list}) VALUES ({placeholders})", rows)
+
+
+# Value in the COPY text format
+def copy_value(value):
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+# On SQLite, lets readers keep searching during the load (WAL) and skips the fsync of
+# every commit, which WAL keeps safe. Settings are restored afterwards.
+@contextlib.contextmanager
+def bulk_load():
+    if connection.vendor != "sqlite":
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA synchronous")
+        synchronous = cursor.fetchone()[0]
+        cursor.execute("PRAGMA cache_size")
+        cache_size = cursor.fetchone()[0]
+        cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.execute("PRAGMA synchronous = NORMAL")
+        cursor.execute("PRAGMA cache_size = -65536")
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA synchronous = {int(synchronous)}")
+            cursor.execute(f"PRAGMA cache_size = {int(cache_size)}")
@@ -0,0 +1,105 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "voca.settings")
+
+import django
+
+django.setup()
+
+from benchmark_translation import requests
+from sentences.translation import TranslationBackend, TranslationDispatcher
+
+
+# Answers like the translate v2 REST API after latency seconds, and records its load
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, latency):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.calls += 1
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        time.sleep(server.latency)
+        with server.lock:
+            server.active -= 1
+        translations = [{"translatedText": f"[{body['source']}->{body['target']}] {q}"} for q in body["q"]]
+        response = json.dumps({"data": {"translations": translations}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubBackend(TranslationBackend):
+    def __init__(self, url):
+        self.url = url
+
+    def translate(self, texts, target, source=None):
+        body = json.dumps({"q": list(texts), "target": target, "source": source}).encode("utf-8")
+        request = urllib.request.Request(self.url, body, {"Content-Type": "application/json"})
+        with urllib.request.urlopen(request) as response:
+            return [t["translatedText"] for t in json.loads(response.read())["data"]["translations"]]
+
+
+def run(name, translate, texts, users, server):
+    server.calls = server.max_active = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(users) as pool:
+        list(pool.map(lambda text: translate([text], "en", "de"), texts))
+    elapsed = time.perf_counter() - started
+    print(f"{name:>10}: {len(texts)} requests in {elapsed:.1f}s, {len(texts) / elapsed:.0f} requests/s, "
+          f"{server.calls} calls, {server.max_active} at once")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare direct and dispatched translation calls from concurrent "
+                                                 "users, against a local stub of the translation API.")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--distinct", type=int, default=500, help="Distinct sentences requested")
+    parser.add_argument("--users", type=int, default=32, help="Concurrent requests")
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds per API call")
+    parser.add_argument("--window", type=float, default=0.01)
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = StubServer(args.latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        backend = StubBackend(f"http://127.0.0.1:{server.server_port}/language/translate/v2")
+        texts = requests(args.distinct, args.requests, args.seed)
+        run("direct", backend.translate, texts, args.users, server)
+        dispatcher = TranslationDispatcher(backend, window=args.window, max_concurrency=args.max_concurrency)
+        run("dispatched", dispatcher.translate, texts, args.users, server)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
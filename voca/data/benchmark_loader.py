@@ -0,0 +1,63 @@
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "voca.settings")
+
+import django
+from django.conf import settings
+from django.db import connection
+
+
+def write_scored_corpus(directory, lang, domain, rows, seed):
+    from benchmark_scoring import read_chunks, write_corpus
+    from process import Sentences
+    os.makedirs(os.path.join(directory, "data", lang))
+    path = os.path.join(directory, "sentences.tsv")
+    write_corpus(path, rows, seed)
+    for chunk in read_chunks(path):
+        s = Sentences(chunk)
+        s.score_sentences()
+        s.df_sentences.to_csv(os.path.join(directory, "data", lang, domain + "-sentences-scored.tsv"),
+                              sep="\t", mode="a", header=None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the rows/s of the ORM and the native corpus loader, "
+                                                 "on a test database of the configured backend.")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # A file rather than the in-memory default, so that SQLite timings include the disk
+        settings.DATABASES["default"].setdefault("TEST", {})
+        if settings.DATABASES["default"]["ENGINE"].endswith("sqlite3"):
+            settings.DATABASES["default"]["TEST"]["NAME"] = os.path.join(directory, "benchmark.sqlite3")
+        django.setup()
+        from data.add_to_model import add_to_model
+        from sentences.models import Sentence
+
+        write_scored_corpus(directory, "de", "news", args.rows, args.seed)
+        old_name = connection.creation.create_test_db(verbosity=0)
+        os.chdir(directory)
+        try:
+            for loader in ["orm", "native"]:
+                started = time.perf_counter()
+                add_to_model.add("de", "news", "benchmark", sample_size=None, loader=loader)
+                elapsed = time.perf_counter() - started
+                count = Sentence.objects.filter(generation__active=True).count()
+                print(f"{loader:>6}: {count} sentences and their tokens in {elapsed:.1f}s, {count / elapsed:.0f} rows/s")
+            for thread in threading.enumerate():
+                if thread.name == "corpus-gc":
+                    thread.join()
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import os
+import re
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from process import Sentences
+
+words = ["der", "Hund", "hat", "Hunger", "Katze", "schläft", "auf", "dem", "Sofa", "Bundesregierung",
+         "heute", "morgen", "Straße", "Öffentlichkeit", "und", "die", "l'été", "2020", "über", "ist"]
+
+
+# Former row by row scorer of Sentences.score_sentences, kept for comparison
+def score_sentences_iterrows(s):
+    # Newer pandas no longer upcast the int column on a float assignment
+    s.df_sentences["avg_word_length"] = s.df_sentences["avg_word_length"].astype(float)
+    for index, row in s.df_sentences.iterrows():
+        words = re.findall(r'\w+', row["sentence"])
+        s.df_sentences.loc[index, "sentence_length"] = len(words)
+        s.df_sentences.loc[index, "avg_word_length"] = np.mean([float(len(w)) for w in words])
+
+
+def write_corpus(path, rows, seed):
+    rng = np.random.default_rng(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for start in range(0, rows, 100000):
+            count = min(100000, rows - start)
+            lengths = rng.integers(3, 40, count)
+            picks = rng.integers(0, len(words), lengths.sum())
+            offset = 0
+            for i, length in enumerate(lengths):
+                sentence = " ".join(words[w] for w in picks[offset:offset + length])
+                offset += length
+                f.write(f"{start + i + 1}\t{sentence[0].upper()}{sentence[1:]}.\n")
+
+
+def read_chunks(path):
+    return pd.read_csv(path, sep="\t", index_col=0, names=["id", "sentence"], chunksize=10000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the vectorized and the iterrows sentence scorer.")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--legacy-chunks", type=int, default=3,
+                        help="10k-row chunks scored with iterrows, its total time is extrapolated")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sentences.tsv")
+        write_corpus(path, args.rows, args.seed)
+
+        vectorized = 0
+        for chunk in read_chunks(path):
+            s = Sentences(chunk)
+            started = time.perf_counter()
+            s.score_sentences()
+            vectorized += time.perf_counter() - started
+
+        legacy = 0
+        legacy_rows = 0
+        for chunk, _ in zip(read_chunks(path), range(args.legacy_chunks)):
+            s = Sentences(chunk)
+            expected = Sentences(chunk)
+            expected.score_sentences()
+            started = time.perf_counter()
+            score_sentences_iterrows(s)
+            legacy += time.perf_counter() - started
+            legacy_rows += len(s.df_sentences)
+            pd.testing.assert_frame_equal(s.df_sentences, expected.df_sentences, check_dtype=False)
+
+    print(f"vectorized: {vectorized:.2f}s for {args.rows} rows")
+    if legacy_rows:
+        estimate = legacy * args.rows / legacy_rows
+        print(f"iterrows:   {legacy:.2f}s for {legacy_rows} rows, ~{estimate:.0f}s for {args.rows} rows "
+              f"({estimate / vectorized:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
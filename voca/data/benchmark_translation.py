@@ -0,0 +1,57 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "voca.settings")
+
+import django
+from django.conf import settings
+from django.db import connection
+
+
+def requests(distinct, count, seed):
+    # Popular sentences are translated far more often than the rest, as in the corpus
+    rng = random.Random(seed)
+    sentences = [f"Satz Nummer {i} aus dem Korpus." for i in range(distinct)]
+    return rng.choices(sentences, weights=[1 / (rank + 1) for rank in range(distinct)], k=count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare translation requests/s with and without the translation "
+                                                 "table, against the offline FakeBackend.")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--distinct", type=int, default=500, help="Distinct sentences requested")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per backend call")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        settings.DATABASES["default"].setdefault("TEST", {})
+        if settings.DATABASES["default"]["ENGINE"].endswith("sqlite3"):
+            settings.DATABASES["default"]["TEST"]["NAME"] = os.path.join(directory, "benchmark.sqlite3")
+        django.setup()
+        from sentences.translation import FakeBackend, Translator
+
+        texts = requests(args.distinct, args.requests, args.seed)
+        old_name = connection.creation.create_test_db(verbosity=0)
+        try:
+            for name, cached in [("backend", False), ("cached", True)]:
+                translator = Translator()
+                translator.backend = FakeBackend(latency=args.latency)
+                translate = translator.translate if cached else translator.backend.translate
+                started = time.perf_counter()
+                for text in texts:
+                    translate([text], "en", "de")
+                elapsed = time.perf_counter() - started
+                print(f"{name:>8}: {len(texts)} requests in {elapsed:.1f}s, {len(texts) / elapsed:.0f} requests/s, "
+                      f"{translator.backend.calls} backend calls")
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import argparse
+import collections
+import logging
+import os
+import shutil
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import pandas as pd
+import tqdm
+from process import CHUNK_SIZE, Sentences, build_base_url
+
+logger = logging.getLogger(__name__)
+
+# Order of the former process_all.sh
+PAIRS = [
+    ("it", "web"), ("it", "news"),
+    ("de", "web"), ("de", "news"),
+    ("nl", "web"), ("nl", "news"),
+    ("es", "web"), ("es", "news"),
+    ("fr", "web"), ("fr", "news"),
+    ("en", "web"), ("en", "news"),
+]
+
+
+def scored_path(lang, domain):
+    return build_base_url(lang, domain) + "-sentences-scored.tsv"
+
+
+# Scored chunks of a pair, one file per chunk. A chunk file only exists once it is
+# complete, so it records the chunk as done for a resumed run.
+def parts_dir(lang, domain):
+    return scored_path(lang, domain) + ".parts"
+
+
+def part_path(lang, domain, index):
+    return os.path.join(parts_dir(lang, domain), f"{index:06d}.tsv")
+
+
+def score_chunk(df_chunk, path):
+    s = Sentences(df_chunk)
+    s.score_sentences()
+    s.df_sentences.to_csv(path + ".tmp", sep="\t", header=None)
+    os.replace(path + ".tmp", path)
+
+
+def merge_parts(lang, domain, chunks):
+    # Chunks are concatenated in input order, whichever worker finished first
+    path = scored_path(lang, domain)
+    with open(path + ".tmp", "wb") as scored:
+        for index in range(chunks):
+            with open(part_path(lang, domain, index), "rb") as part:
+                shutil.copyfileobj(part, scored)
+    os.replace(path + ".tmp", path)
+    shutil.rmtree(parts_dir(lang, domain))
+
+
+def pending_chunks(pairs, chunk_counts):
+    for lang, domain in pairs:
+        if os.path.exists(scored_path(lang, domain)) and not os.path.exists(parts_dir(lang, domain)):
+            continue
+        sentences_path = build_base_url(lang, domain) + "-sentences.tsv"
+        # A missing corpus only skips its own pair, as a separate process.py run did
+        if not os.path.exists(sentences_path):
+            logger.warning("Skipping %s %s, %s does not exist.", lang, domain, sentences_path)
+            continue
+        df_chunks = pd.read_csv(sentences_path, sep="\t", index_col=0, names=["id", "sentence"],
+                                chunksize=CHUNK_SIZE)
+        os.makedirs(parts_dir(lang, domain), exist_ok=True)
+        index = -1
+        for index, df_chunk in enumerate(df_chunks):
+            if not os.path.exists(part_path(lang, domain, index)):
+                yield (lang, domain), df_chunk, part_path(lang, domain, index)
+        chunk_counts[(lang, domain)] = index + 1
+        # Marks the pair as fully read, so it can merge when its last chunk is done
+        yield (lang, domain), None, None
+
+
+def process_all(pairs, workers=None):
+    workers = workers or os.cpu_count()
+    chunk_counts = {}
+    running = collections.Counter()
+    futures = {}
+    jobs = pending_chunks(pairs, chunk_counts)
+    with ProcessPoolExecutor(max_workers=workers) as executor, tqdm.tqdm(unit="chunk") as progress:
+        # Chunks are read ahead of the workers by a bounded amount only
+        max_pending = 2 * workers
+        read_all = False
+        while not read_all or futures:
+            while not read_all and len(futures) < max_pending:
+                try:
+                    pair, df_chunk, path = next(jobs)
+                except StopIteration:
+                    read_all = True
+                    break
+                if df_chunk is not None:
+                    futures[executor.submit(score_chunk, df_chunk, path)] = pair
+                    running[pair] += 1
+                elif not running[pair]:
+                    merge_parts(*pair, chunk_counts[pair])
+            if not futures:
+                continue
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                pair = futures.pop(future)
+                future.result()
+                running[pair] -= 1
+                progress.update()
+                if pair in chunk_counts and not running[pair]:
+                    merge_parts(*pair, chunk_counts[pair])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score the sentences of every language and domain in parallel.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes, the CPU count by default")
+    parser.add_argument("--languages", nargs="+", help="Only these languages")
+    parser.add_argument("--domains", nargs="+", help="Only these domains")
+    args = parser.parse_args()
+    process_all([(lang, domain) for lang, domain in PAIRS
+                 if (not args.languages or lang in args.languages) and (not args.domains or domain in args.domains)],
+                args.workers)
@@ -1,12 +1 @@
-python process.py it web
-python process.py it news
-python process.py de web
-python process.py de news
-python process.py nl web
-python process.py nl news
-python process.py es web
-python process.py es news
-python process.py fr web
-python process.py fr news
-python process.py en web
-python process.py en news
+python process_all.py "$@"
@@ -0,0 +1,37 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import process_all  # noqa: E402
+
+
+class ProcessAllTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        os.makedirs("de")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_missing_input_skips_only_its_pair(self):
+        for domain in ["web", "news"]:
+            with open(f"de/{domain}-sentences.tsv", "w") as sentences:
+                sentences.write("1\tDas ist ein Satz.\n2\tNoch ein Satz.\n")
+        with self.assertLogs(process_all.logger, "WARNING") as logs:
+            process_all.process_all([("de", "web"), ("fr", "news"), ("de", "news")], workers=1)
+        self.assertIn("fr news", logs.output[0])
+        for domain in ["web", "news"]:
+            with open(process_all.scored_path("de", domain)) as scored:
+                self.assertEqual(len(scored.readlines()), 2)
+            self.assertFalse(os.path.exists(process_all.parts_dir("de", domain)))
+        self.assertFalse(os.path.exists("fr"))
+
+
+if __name__ == "__main__":
+    unittest.main()
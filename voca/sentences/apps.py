@@ -1,5 +1,11 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class SentencesConfig(AppConfig):
     name = 'sentences'
+
+    def ready(self):
+        # Runs in the gunicorn master with --preload, so workers share the loaded lexicons
+        from .nlp.pattern_registry import pattern_registry
+        pattern_registry.prewarm(getattr(settings, "PATTERN_PREWARM", []))
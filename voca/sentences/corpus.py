@@ -0,0 +1,56 @@
+import logging
+import threading
+from django.db import connection, transaction
+from .models import CorpusGeneration, Sentence
+
+logger = logging.getLogger(__name__)
+
+GC_BATCH_SIZE = 1000
+
+
+def active_generations(language, categories):
+    return CorpusGeneration.objects.filter(active=True, language__exact=language, category__in=categories)
+
+
+def activate_generation(generation):
+    # Searches switch from the previous generation to this one in a single commit
+    with transaction.atomic():
+        CorpusGeneration.objects.filter(language__exact=generation.language, category__exact=generation.category,
+                                        active=True).update(active=False)
+        generation.active = True
+        generation.save(update_fields=["active"])
+
+
+# Generations replaced by a newer active one, or left behind by a failed import. Those
+# newer than the active generation may still be loading and are kept.
+def stale_generations():
+    for active in CorpusGeneration.objects.filter(active=True):
+        yield from CorpusGeneration.objects.filter(language__exact=active.language, category__exact=active.category,
+                                                   active=False, id__lt=active.id)
+
+
+def collect_garbage(batch_size=GC_BATCH_SIZE):
+    for generation in list(stale_generations()):
+        while True:
+            ids = list(generation.sentences.values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            # Short transactions, so that imports and reports are never held up for long
+            with transaction.atomic():
+                Sentence.objects.filter(id__in=ids).delete()
+        generation.delete()
+        logger.info("Collected generation %s of %s %s.", generation.id, generation.language, generation.category)
+
+
+def collect_garbage_in_background(batch_size=GC_BATCH_SIZE):
+    def collect():
+        try:
+            collect_garbage(batch_size)
+        except Exception:
+            logger.exception("Failed to collect old corpus generations.")
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=collect, name="corpus-gc")
+    thread.start()
+    return thread
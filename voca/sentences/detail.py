@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.functional import cached_property
+from .models import Sentence
+from .serializers import SentenceSerializer
+
+
+# Read-through cache of serialized sentences keyed by ref_id. Reports evict the entry they
+# change; with a per-process cache other workers see the change after the cache TIMEOUT.
+class SentenceCache:
+
+    @cached_property
+    def cache(self):
+        alias = getattr(settings, "SENTENCE_CACHE", None)
+        return caches[alias] if alias else None
+
+    def get(self, ref_id):
+        if self.cache is None:
+            return self.__load(ref_id)
+        key = self.key(ref_id)
+        data = self.cache.get(key)
+        if data is None:
+            data = self.__load(ref_id)
+            self.cache.set(key, data)
+        return data
+
+    def evict(self, ref_id):
+        if self.cache is not None:
+            self.cache.delete(self.key(ref_id))
+
+    @staticmethod
+    def key(ref_id):
+        return f"sentence:{ref_id.hex}"
+
+    @staticmethod
+    def __load(ref_id):
+        # Raises Sentence.DoesNotExist, not cached
+        return SentenceSerializer(Sentence.objects.get(ref_id=ref_id)).data
+
+
+sentence_cache = SentenceCache()
@@ -0,0 +1,91 @@
+import hashlib
+import itertools
+import os
+import threading
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.functional import cached_property
+from .nlp import nlp_pool, sen_features
+from .nlp.tagger_poll import tagger_poll
+from .utils import wordtype2group
+
+# Bumped when the response built from the same resources changes
+FORMS_RESPONSE_VERSION = 1
+
+
+def word_forms_response(language, word, group=None):
+    response = {"forms": []}
+    with nlp_pool.acquire(language) as nlp:
+        if not nlp.is_noun(word):
+            word = word.lower()
+        response["search_term"] = make_form_obj(word, nlp, initial=True, search_group=group)
+        word_forms = nlp.get_word_forms(word, search_group=group)
+        if group is not None:
+            search_form_group = group
+        else:
+            search_form_group = response["search_term"]["group"]
+        form_objs = make_form_objs(word_forms, nlp, search_group=search_form_group)
+        response["possible_groups"] = nlp.possible_groups()
+    forms = sorted([f for f in form_objs if f["group"] == search_form_group], key=lambda k: k["word_type"])
+    response["forms"] = [{
+        "word_type": key,
+        "group": wordtype2group(key),
+        "results": list(group)} for (key, group) in itertools.groupby(forms, key=lambda k: k["word_type"])
+    ]
+    return response
+
+
+def make_form_obj(word, nlp, search_group=None, initial=False):
+    typ, group, pos = nlp.get_pos_tag(word, search_group, initial)
+    return {"word": word, "pos": pos, "word_type": typ, "group": group}
+
+
+def make_form_objs(words, nlp, search_group=None):
+    # All forms are tagged in a single TreeTagger round-trip
+    return [{"word": word, "pos": pos, "word_type": typ, "group": group}
+            for word, (typ, group, pos) in zip(words, nlp.get_pos_tags(words, search_group))]
+
+
+# Whole word_forms_response results, which only depend on the pattern lexicons and the
+# TreeTagger parameter file. Their versions are part of the keys, so an upgrade of either
+# misses the old entries instead of serving them.
+class FormsCache:
+    def __init__(self):
+        self.versions = {}
+        self.lock = threading.Lock()
+
+    @cached_property
+    def cache(self):
+        alias = getattr(settings, "FORMS_CACHE", None)
+        return caches[alias] if alias else None
+
+    def get_or_build(self, language, word, group=None):
+        if self.cache is None or language not in sen_features:
+            return word_forms_response(language, word, group)
+        key = self.key(language, word, group)
+        response = self.cache.get(key)
+        if response is None:
+            response = word_forms_response(language, word, group)
+            self.cache.set(key, response)
+        return response
+
+    def key(self, language, word, group):
+        word_hash = hashlib.md5(word.encode("utf-8")).hexdigest()
+        return f"forms:{self.resource_version(language)}:{language}:{group}:{word_hash}"
+
+    def resource_version(self, language):
+        with self.lock:
+            if language not in self.versions:
+                self.versions[language] = self.__resource_version(language)
+            return self.versions[language]
+
+    @staticmethod
+    def __resource_version(language):
+        import pattern
+        parfile = tagger_poll.preprocessor(language).tagparfile
+        stat = os.stat(parfile)
+        resources = f"{FORMS_RESPONSE_VERSION}|{getattr(pattern, '__version__', '')}|{parfile}:{stat.st_size}:{stat.st_mtime_ns}"
+        return hashlib.md5(resources.encode("utf-8")).hexdigest()[:12]
+
+
+forms_cache = FormsCache()
@@ -0,0 +1,67 @@
+import itertools
+import json
+import tqdm
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from sentences.models import LexiconEntry, SentenceToken
+from sentences.nlp import NLP, sen_features
+
+
+class Command(BaseCommand):
+    help = "Computes the tag probabilities and forms of every distinct token of the corpus into the lexicon table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--languages", nargs="+", default=list(sen_features))
+        parser.add_argument("--batch-size", type=int, default=500, help="Tokens tagged and stored at once")
+
+    def handle(self, *args, **options):
+        for language in options["languages"]:
+            nlp = NLP(language)
+            tokens = (SentenceToken.objects
+                      .filter(language__exact=language, sentence__generation__active=True)
+                      .values_list("token", flat=True)
+                      .distinct()
+                      .iterator())
+            stored = 0
+            with tqdm.tqdm(desc=language, unit=" words") as progress:
+                while True:
+                    words = list(itertools.islice(tokens, options["batch_size"]))
+                    if not words:
+                        break
+                    entries = self.lexicon_entries(nlp, words)
+                    with transaction.atomic():
+                        LexiconEntry.objects.filter(language__exact=language,
+                                                    word__in=[entry.word for entry in entries]).delete()
+                        LexiconEntry.objects.bulk_create(entries)
+                    stored += len(entries)
+                    progress.update(len(words))
+            self.stdout.write(f"{language}: {stored} words stored.")
+
+    def lexicon_entries(self, nlp, words):
+        # Rows are keyed by the token tag_words looks words up by, which may differ from the
+        # corpus token (e.g. with an apostrophe)
+        tokens = []
+        for word in words:
+            try:
+                tokens.append(nlp.voca_tagger.first_token(word))
+            except ValueError:
+                continue
+        words = list(dict.fromkeys(tokens))
+        # One TreeTagger round-trip for the batch, bypassing the lexicon being rebuilt
+        probabilities = nlp.voca_tagger.tag_words(words, use_lexicon=False)
+        entries = []
+        for word, word_probabilities in zip(words, probabilities):
+            try:
+                lexeme = nlp.get_verb_lexeme(word, use_lexicon=False)
+                noun_forms = nlp.get_noun_forms(word, use_lexicon=False)
+            except Exception as e:
+                self.stderr.write(f"{nlp.lang} {word}: {e}")
+                continue
+            entries.append(LexiconEntry(
+                language=nlp.lang,
+                word=word,
+                probabilities=json.dumps(word_probabilities),
+                lexeme=json.dumps(lexeme),
+                noun_forms=json.dumps(noun_forms),
+            ))
+        return entries
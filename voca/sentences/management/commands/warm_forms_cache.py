@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from sentences.forms import forms_cache
+from sentences.models import SentenceToken
+from sentences.nlp import sen_features
+
+
+class Command(BaseCommand):
+    help = "Fills the word forms cache with the most frequent words of each language of the corpus."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=1000, help="Words per language")
+        parser.add_argument("--languages", nargs="+", default=list(sen_features))
+
+    def handle(self, *args, **options):
+        if forms_cache.cache is None:
+            raise CommandError("FORMS_CACHE is not set.")
+        for language in options["languages"]:
+            words = (SentenceToken.objects
+                     .filter(language__exact=language, sentence__generation__active=True)
+                     .values("token")
+                     .annotate(sentences=Count("sentence"))
+                     .order_by("-sentences")[:options["top"]])
+            failed = 0
+            for word in words:
+                try:
+                    forms_cache.get_or_build(language, word["token"])
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"{language} {word['token']}: {e}")
+            self.stdout.write(f"{language}: {len(words) - failed} words cached, {failed} failed.")
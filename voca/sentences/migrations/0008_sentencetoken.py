@@ -0,0 +1,44 @@
+# Generated by Django 3.0.2 on 2026-10-18 00:20
+
+import re
+from django.db import migrations, models
+import django.db.models.deletion
+
+TOKEN_BATCH_SIZE = 10000
+
+
+def index_sentences(apps, schema_editor):
+    Sentence = apps.get_model('sentences', 'Sentence')
+    SentenceToken = apps.get_model('sentences', 'SentenceToken')
+    tokens = []
+    for sentence_id, language, content in Sentence.objects.values_list('id', 'language', 'content').iterator():
+        tokens.extend(SentenceToken(sentence_id=sentence_id, language=language, token=token)
+                      for token in set(re.findall(r'\w+', content)))
+        if len(tokens) >= TOKEN_BATCH_SIZE:
+            SentenceToken.objects.bulk_create(tokens)
+            tokens = []
+    SentenceToken.objects.bulk_create(tokens)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sentences', '0007_auto_20200322_1202'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SentenceToken',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.TextField(choices=[('de', 'German'), ('en', 'English'), ('es', 'Spanish'), ('fr', 'French')])),
+                ('token', models.CharField(max_length=255)),
+                ('sentence', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tokens', to='sentences.Sentence')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='sentencetoken',
+            index=models.Index(fields=['language', 'token', 'sentence'], name='sentences_s_languag_8b5f0d_idx'),
+        ),
+        migrations.RunPython(index_sentences, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 3.0.2 on 2026-10-18 00:40
+
+from django.db import migrations, models
+
+# sen_features of sentences.nlp when the buckets were introduced
+SENTENCE_LENGTHS = [10, 20, 30]
+WORD_LENGTH_THRESHS = {"en": 11, "de": 14, "fr": 13, "es": 11, "it": 12, "nl": 12}
+
+
+def fill_difficulty(apps, schema_editor):
+    Sentence = apps.get_model('sentences', 'Sentence')
+    for lang, word_length_thresh in WORD_LENGTH_THRESHS.items():
+        sentences = Sentence.objects.filter(language__exact=lang)
+        sentences.filter(sentence_length__lte=SENTENCE_LENGTHS[0],
+                         avg_word_length__lte=word_length_thresh).update(difficulty=0)
+        sentences.filter(sentence_length__gt=SENTENCE_LENGTHS[0],
+                         sentence_length__lte=SENTENCE_LENGTHS[1]).update(difficulty=1)
+        sentences.filter(sentence_length__gt=SENTENCE_LENGTHS[2]).update(difficulty=2)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sentences', '0008_sentencetoken'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='sentence',
+            name='sentences_s_languag_b5e396_idx',
+        ),
+        migrations.AddField(
+            model_name='sentence',
+            name='difficulty',
+            field=models.IntegerField(blank=True, choices=[(0, 'Easy'), (1, 'Moderate'), (2, 'Difficult')], null=True),
+        ),
+        migrations.RunPython(fill_difficulty, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='sentence',
+            index=models.Index(fields=['language', 'category', 'difficulty', 'reports'], name='sentences_s_languag_f95d63_idx'),
+        ),
+    ]
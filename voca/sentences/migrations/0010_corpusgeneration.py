@@ -0,0 +1,57 @@
+# Generated by Django 3.0.2 on 2026-10-18 00:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def add_generations(apps, schema_editor):
+    # Sentences already imported become the active generation of their language and category
+    CorpusGeneration = apps.get_model('sentences', 'CorpusGeneration')
+    Sentence = apps.get_model('sentences', 'Sentence')
+    corpora = Sentence.objects.values_list('language', 'category').distinct()
+    for language, category in list(corpora):
+        generation = CorpusGeneration.objects.create(language=language, category=category, active=True)
+        Sentence.objects.filter(language=language, category=category).update(generation=generation)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sentences', '0009_sentence_difficulty'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CorpusGeneration',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.TextField(choices=[('de', 'German'), ('en', 'English'), ('es', 'Spanish'), ('fr', 'French')])),
+                ('category', models.TextField(blank=True, choices=[('news', 'News'), ('web', 'Web'), ('kids', 'Kids')])),
+                ('active', models.BooleanField(default=False)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='corpusgeneration',
+            constraint=models.UniqueConstraint(condition=models.Q(active=True), fields=('language', 'category'), name='unique_active_generation'),
+        ),
+        migrations.AddField(
+            model_name='sentence',
+            name='generation',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='sentences', to='sentences.CorpusGeneration'),
+        ),
+        migrations.RunPython(add_generations, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='sentence',
+            name='generation',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sentences', to='sentences.CorpusGeneration'),
+        ),
+        migrations.RemoveIndex(
+            model_name='sentence',
+            name='sentences_s_languag_f95d63_idx',
+        ),
+        migrations.AddIndex(
+            model_name='sentence',
+            index=models.Index(fields=['language', 'category', 'generation', 'difficulty', 'reports'], name='sentences_s_languag_602c00_idx'),
+        ),
+    ]
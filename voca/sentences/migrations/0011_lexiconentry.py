@@ -0,0 +1,28 @@
+# Generated by Django 3.0.2 on 2026-10-18 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sentences', '0010_corpusgeneration'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LexiconEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.TextField(choices=[('de', 'German'), ('en', 'English'), ('es', 'Spanish'), ('fr', 'French')])),
+                ('word', models.CharField(max_length=255)),
+                ('probabilities', models.TextField()),
+                ('lexeme', models.TextField()),
+                ('noun_forms', models.TextField()),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='lexiconentry',
+            constraint=models.UniqueConstraint(fields=('language', 'word'), name='unique_lexicon_word'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 3.0.2 on 2026-10-18 01:30
+
+import re
+from django.db import migrations, models
+
+SENTENCE_BATCH_SIZE = 1000
+
+
+def index_positions(apps, schema_editor):
+    # Tokens are indexed again, sentence batch by sentence batch, now with their offsets
+    Sentence = apps.get_model('sentences', 'Sentence')
+    SentenceToken = apps.get_model('sentences', 'SentenceToken')
+    last_id = 0
+    while True:
+        sentences = list(Sentence.objects.filter(id__gt=last_id).order_by('id')
+                         .values_list('id', 'language', 'content')[:SENTENCE_BATCH_SIZE])
+        if not sentences:
+            break
+        last_id = sentences[-1][0]
+        tokens = []
+        for sentence_id, language, content in sentences:
+            positions = {}
+            for match in re.finditer(r'\w+', content):
+                positions.setdefault(match.group(), []).append(str(match.start()))
+            tokens.extend(SentenceToken(sentence_id=sentence_id, language=language, token=token,
+                                        positions=','.join(starts)) for token, starts in positions.items())
+        SentenceToken.objects.filter(sentence_id__in=[sentence[0] for sentence in sentences]).delete()
+        SentenceToken.objects.bulk_create(tokens)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sentences', '0011_lexiconentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sentencetoken',
+            name='positions',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.RunPython(index_positions, migrations.RunPython.noop),
+    ]
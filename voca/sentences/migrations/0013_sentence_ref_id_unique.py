@@ -0,0 +1,19 @@
+# Generated by Django 3.0.2 on 2026-10-18 03:40
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sentences', '0012_sentencetoken_positions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='sentence',
+            name='ref_id',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+        ),
+    ]
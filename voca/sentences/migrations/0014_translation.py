@@ -0,0 +1,28 @@
+# Generated by Django 3.0.2 on 2026-10-18 04:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sentences', '0013_sentence_ref_id_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Translation',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text_hash', models.CharField(max_length=64)),
+                ('source', models.CharField(blank=True, max_length=8)),
+                ('target', models.CharField(max_length=8)),
+                ('translation', models.TextField()),
+                ('created', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='translation',
+            constraint=models.UniqueConstraint(fields=('text_hash', 'source', 'target'), name='unique_translation'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.core.management import call_command
+from django.db import migrations
+
+
+# Tables of the DatabaseCache entries of settings.CACHES, such as the forms cache.
+# createcachetable skips the tables which exist already.
+def create_cache_tables(apps, schema_editor):
+    call_command("createcachetable", database=schema_editor.connection.alias, verbosity=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sentences', '0014_translation'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_tables, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,5 @@
 from django.db import models
-from .fields import Category, LangISO
+from .fields import Category, DifficultyLevel, LangISO
 from django.contrib.auth.models import User
 from django.dispatch import receiver
 from django.db.models.signals import post_save
@@ -7,8 +7,24 @@ from rest_framework.authtoken.models import Token
 import uuid
 
 
+# One import of the sentences of a language and category. Searches only see the active
+# generation, so a new one is loaded beside it and swapped in at once.
+class CorpusGeneration(models.Model):
+    language = models.TextField(choices=LangISO.choices)
+    category = models.TextField(choices=Category.choices, blank=True)
+    active = models.BooleanField(default=False)
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['language', 'category'], condition=models.Q(active=True),
+                                    name='unique_active_generation'),
+        ]
+
+
 class Sentence(models.Model):
-    ref_id = models.UUIDField(default=uuid.uuid4, editable=False)
+    # Native uuid on PostgreSQL, 32 hex characters elsewhere
+    ref_id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
     sentence_length = models.FloatField(default=0)
     avg_word_length = models.FloatField(default=0)
     reports = models.IntegerField(default=0)
@@ -16,10 +32,58 @@ class Sentence(models.Model):
     content = models.CharField(max_length=255)
     source = models.CharField(max_length=255, blank=True)
     category = models.TextField(choices=Category.choices, blank=True)
+    # Bucket of build_difficulty_filter, None for sentences in none of them
+    difficulty = models.IntegerField(choices=DifficultyLevel.choices, null=True, blank=True)
+    generation = models.ForeignKey(CorpusGeneration, on_delete=models.CASCADE, related_name='sentences')
 
     class Meta:
         indexes = [
-            models.Index(fields=['language']),
+            models.Index(fields=['language', 'category', 'generation', 'difficulty', 'reports']),
+        ]
+
+
+# Inverted index of the words of each sentence, searched instead of matching content
+class SentenceToken(models.Model):
+    sentence = models.ForeignKey(Sentence, on_delete=models.CASCADE, related_name='tokens')
+    language = models.TextField(choices=LangISO.choices)
+    token = models.CharField(max_length=255)
+    # Comma separated start offsets of the token in the sentence, in characters
+    positions = models.TextField(default='', blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['language', 'token', 'sentence']),
+        ]
+
+
+# Tag probabilities and forms of a corpus token, computed offline by manage.py build_lexicon
+# so that requests only fall back to TreeTagger and pattern for unseen words. Values are
+# JSON: {pos: probability} and lists of words.
+class LexiconEntry(models.Model):
+    language = models.TextField(choices=LangISO.choices)
+    word = models.CharField(max_length=255)
+    probabilities = models.TextField()
+    lexeme = models.TextField()
+    noun_forms = models.TextField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['language', 'word'], name='unique_lexicon_word'),
+        ]
+
+
+# Translations of texts by sha256, see sentences.translation. Source is empty when the
+# backend detected the language.
+class Translation(models.Model):
+    text_hash = models.CharField(max_length=64)
+    source = models.CharField(max_length=8, blank=True)
+    target = models.CharField(max_length=8)
+    translation = models.TextField()
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['text_hash', 'source', 'target'], name='unique_translation'),
         ]
 
 
@@ -1,2 +1,3 @@
 from .nlp import *
 from .tree_tagger import *
+from .pool import *
@@ -0,0 +1,100 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.functional import cached_property
+
+DEFAULT_TAG_CACHE = {
+    "MAX_SIZE": 50000,
+    # Seconds before an entry is tagged again, None to keep entries until evicted
+    "TTL": None,
+    # Alias of a Django cache shared between processes, None to only cache in-process
+    "SHARED_CACHE": None,
+}
+
+
+# LRU of TreeTagger probability dicts keyed by (language, token). prefix tells apart the
+# entries of other instances in the shared cache.
+class TagCache:
+    def __init__(self, prefix="tag"):
+        self.prefix = prefix
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self.evictions = 0
+
+    @cached_property
+    def config(self):
+        return {**DEFAULT_TAG_CACHE, **getattr(settings, "TAG_CACHE", {})}
+
+    @cached_property
+    def shared_cache(self):
+        alias = self.config["SHARED_CACHE"]
+        return caches[alias] if alias else None
+
+    def get_many(self, lang, tokens):
+        tokens = list(dict.fromkeys(tokens))
+        found = {}
+        now = time.monotonic()
+        with self.lock:
+            for token in tokens:
+                entry = self.entries.get((lang, token))
+                if entry is None or (entry[0] is not None and entry[0] < now):
+                    continue
+                self.entries.move_to_end((lang, token))
+                found[token] = entry[1]
+        missing = [token for token in tokens if token not in found]
+        shared = {}
+        if missing and self.shared_cache is not None:
+            keys = {self.__shared_key(lang, token): token for token in missing}
+            shared = {keys[key]: value for key, value in self.shared_cache.get_many(list(keys)).items()}
+            self.__store(lang, shared)
+            found.update(shared)
+        with self.lock:
+            self.hits += len(found)
+            self.shared_hits += len(shared)
+            self.misses += len(tokens) - len(found)
+        return found
+
+    def set_many(self, lang, probabilities):
+        self.__store(lang, probabilities)
+        if self.shared_cache is not None:
+            self.shared_cache.set_many({self.__shared_key(lang, token): value
+                                        for token, value in probabilities.items()}, timeout=self.config["TTL"])
+
+    def stats(self):
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared_hits": self.shared_hits,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __store(self, lang, probabilities):
+        ttl = self.config["TTL"]
+        expires = time.monotonic() + ttl if ttl is not None else None
+        with self.lock:
+            for token, value in probabilities.items():
+                self.entries[(lang, token)] = (expires, value)
+                self.entries.move_to_end((lang, token))
+            while len(self.entries) > self.config["MAX_SIZE"]:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def __shared_key(self, lang, token):
+        # Tokens may contain characters that aren't valid in memcached keys
+        return self.prefix + ":" + lang + ":" + hashlib.md5(token.encode("utf-8")).hexdigest()
+
+
+tag_cache = TagCache()
+# Stored forms of lexicon words, see sentences.nlp.lexicon
+lexicon_cache = TagCache("lexicon")
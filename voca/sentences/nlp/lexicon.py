@@ -0,0 +1,21 @@
+import json
+from ..models import LexiconEntry
+from .cache import lexicon_cache
+
+
+# Lookups in the LexiconEntry table filled by manage.py build_lexicon
+def stored_probabilities(lang, tokens):
+    entries = LexiconEntry.objects.filter(language__exact=lang, word__in=tokens).values_list("word", "probabilities")
+    return {word: json.loads(probabilities) for word, probabilities in entries}
+
+
+def stored_forms(lang, word, kind):
+    # kind is "lexeme" or "noun_forms", None if the word isn't in the lexicon. Both kinds are
+    # cached together, and so are words missing from the lexicon.
+    forms = lexicon_cache.get_many(lang, [word]).get(word)
+    if forms is None:
+        entry = LexiconEntry.objects.filter(language__exact=lang, word__exact=word) \
+            .values("lexeme", "noun_forms").first()
+        forms = {key: json.loads(value) for key, value in entry.items()} if entry is not None else {}
+        lexicon_cache.set_many(lang, {word: forms})
+    return forms.get(kind)
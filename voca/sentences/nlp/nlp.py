@@ -1,3 +1,6 @@
+from ..fields import DifficultyLevel
+from .lexicon import stored_forms
+from .pattern_registry import pattern_registry
 from .tree_tagger import VocaTagger
 
 sen_features = {
@@ -28,26 +31,33 @@ sen_features = {
 }
 
 
+# Difficulty of a sentence, stored at ingest. None when it fits none of the levels.
+def difficulty_bucket(lang, sentence_length, avg_word_length):
+    lang_features = sen_features[lang]
+    lang_sen_features = lang_features["sentence_length"]
+    if sentence_length <= lang_sen_features[0] and avg_word_length <= lang_features["word_length_thresh"]:
+        return DifficultyLevel.EASY
+    elif lang_sen_features[0] < sentence_length <= lang_sen_features[1]:
+        return DifficultyLevel.MODERATE
+    elif sentence_length > lang_sen_features[2]:
+        return DifficultyLevel.DIFFICULT
+    return None
+
+
+# Sentence filter of a difficulty level; anything but easy and moderate is difficult
+def build_difficulty_filter(difficulty):
+    if difficulty in (DifficultyLevel.EASY, DifficultyLevel.MODERATE):
+        return {"difficulty": difficulty}
+    return {"difficulty": DifficultyLevel.DIFFICULT}
+
+
 class NLP:
     def __init__(self, lang):
-        if lang == "en":
-            from pattern.en import parse, pluralize, singularize, verbs
-        elif lang == "de":
-            from pattern.de import parse, pluralize, singularize, verbs
-        elif lang == "fr":
-            from pattern.fr import parse, pluralize, singularize, verbs
-        elif lang == "es":
-            from pattern.es import parse, pluralize, singularize, verbs
-        elif lang == "it":
-            from pattern.it import parse, pluralize, singularize, verbs
-        elif lang == "nl":
-            from pattern.nl import parse, pluralize, singularize, verbs
-        else:
-            raise NotImplementedError(f"Language code {lang} not supported.")
-        self.parse = parse
-        self.pluralize = pluralize
-        self.singularize = singularize
-        self.verbs = verbs
+        pattern = pattern_registry.get(lang)
+        self.parse = pattern.parse
+        self.pluralize = pattern.pluralize
+        self.singularize = pattern.singularize
+        self.verbs = pattern.verbs
         self.lang = lang
         self.voca_tagger = VocaTagger(lang=lang)
 
@@ -67,39 +77,31 @@ class NLP:
         typ, group, pos = self.voca_tagger.word_tag_info(word, search_group, initial)
         return typ, group, pos
 
+    def get_pos_tags(self, words, search_group):
+        return self.voca_tagger.words_tag_info(words, search_group)
+
     def is_verb(self, word):
         return self.voca_tagger.is_verb(word)
 
     def is_noun(self, word):
         return self.voca_tagger.is_noun(word)
 
-    def get_verb_lexeme(self, verb):
-        return self.verbs.lexeme(verb)
+    def get_verb_lexeme(self, verb, use_lexicon=True):
+        stored = stored_forms(self.lang, verb, "lexeme") if use_lexicon else None
+        return stored if stored is not None else self.verbs.lexeme(verb)
 
-    def get_noun_forms(self, noun):
-        return list({self.singularize(noun), self.pluralize(noun)})
+    def get_noun_forms(self, noun, use_lexicon=True):
+        stored = stored_forms(self.lang, noun, "noun_forms") if use_lexicon else None
+        return stored if stored is not None else list({self.singularize(noun), self.pluralize(noun)})
 
     def get_word_forms(self, word, search_group=None):
-        if (self.is_verb(word) and search_group != "noun") or search_group == "verb":
+        # Tag the word once for both the verb and the noun check
+        return self.__word_forms(word, self.voca_tagger.tag_word(word), search_group)
+
+    def __word_forms(self, word, pos, search_group):
+        if (self.voca_tagger.pos_is_verb(pos) and search_group != "noun") or search_group == "verb":
             return self.get_verb_lexeme(word)
-        elif (self.is_noun(word) and search_group != "verb") or search_group == "noun":
+        elif (self.voca_tagger.pos_is_noun(pos) and search_group != "verb") or search_group == "noun":
             return self.get_noun_forms(word)
         else:
             return [word]
-
-    def build_difficulty_filter(self, difficulty):
-        lang_features = sen_features[self.lang]
-        lang_sen_features = lang_features["sentence_length"]
-        if difficulty == 0:
-            return {
-                "sentence_length__lte": lang_sen_features[0],
-                "avg_word_length__lte": lang_features["word_length_thresh"]
-            }
-        elif difficulty == 1:
-            return {
-                "sentence_length__lte": lang_sen_features[1],
-                "sentence_length__gt": lang_sen_features[0],
-            }
-        return {
-            "sentence_length__gt": lang_sen_features[2],
-        }
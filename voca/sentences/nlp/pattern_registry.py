@@ -0,0 +1,35 @@
+import importlib
+import threading
+
+PATTERN_LANGUAGES = ["en", "de", "fr", "es", "it", "nl"]
+
+
+# pattern.<lang> modules, imported once per process. Importing a language and first using
+# its lexicons reads large files, which prewarm does ahead of the first request.
+class PatternRegistry:
+    def __init__(self):
+        self.modules = {}
+        self.lock = threading.Lock()
+
+    def get(self, lang):
+        module = self.modules.get(lang)
+        if module is None:
+            if lang not in PATTERN_LANGUAGES:
+                raise NotImplementedError(f"Language code {lang} not supported.")
+            with self.lock:
+                if lang not in self.modules:
+                    self.modules[lang] = importlib.import_module("pattern." + lang)
+                module = self.modules[lang]
+        return module
+
+    def prewarm(self, languages):
+        for lang in languages:
+            module = self.get(lang)
+            # Lexicons are lazy dicts which load their file on first access
+            for name in ["lexicon", "verbs"]:
+                load = getattr(getattr(module, name, None), "load", None)
+                if load is not None:
+                    load()
+
+
+pattern_registry = PatternRegistry()
@@ -0,0 +1,77 @@
+import contextlib
+import queue
+import threading
+from django.conf import settings
+from .nlp import NLP, sen_features
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_POOL_TIMEOUT = 30
+
+
+# Bounded set of NLP objects for one language, created on demand. Their tagging goes
+# through the shared tagger poll, which owns and health-checks the tree-tagger processes.
+class LanguagePool:
+    def __init__(self, lang, max_size, timeout):
+        self.lang = lang
+        self.max_size = max_size
+        self.timeout = timeout
+        self.size = 0
+        # LIFO so that the most recently used (warmest) instance is reused first
+        self.idle = queue.LifoQueue()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            can_grow = self.size < self.max_size
+            if can_grow:
+                self.size += 1
+        if can_grow:
+            try:
+                return NLP(self.lang)
+            except Exception:
+                with self.lock:
+                    self.size -= 1
+                raise
+        try:
+            return self.idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No NLP instance available for language {self.lang}.")
+
+    def release(self, nlp):
+        nlp.voca_tagger.probabilities = None
+        self.idle.put(nlp)
+
+
+# Process-wide pool of NLP objects, created lazily per language on first use
+class NLPPool:
+    def __init__(self):
+        self.pools = {}
+        self.lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def acquire(self, lang):
+        pool = self.__language_pool(lang)
+        nlp = pool.acquire()
+        try:
+            yield nlp
+        finally:
+            pool.release(nlp)
+
+    def __language_pool(self, lang):
+        if lang not in sen_features:
+            raise NotImplementedError(f"Language code {lang} not supported.")
+        with self.lock:
+            if lang not in self.pools:
+                self.pools[lang] = LanguagePool(
+                    lang,
+                    max_size=getattr(settings, "NLP_POOL_SIZE", DEFAULT_POOL_SIZE),
+                    timeout=getattr(settings, "NLP_POOL_TIMEOUT", DEFAULT_POOL_TIMEOUT),
+                )
+            return self.pools[lang]
+
+
+nlp_pool = NLPPool()
@@ -111,3 +111,47 @@ pos_patterns = {
         ("Verb (conjunctive present)", "verb",  r"VER:cpre"),
     ]
 }
+
+# Tags of the TreeTagger parameter files for each language, classified once at startup
+pos_tagsets = {
+    "en": [
+        "CC", "CD", "DT", "EX", "FW", "IN", "IN/that", "JJ", "JJR", "JJS", "LS", "MD", "NN", "NNS", "NP", "NPS",
+        "PDT", "POS", "PP", "PP$", "RB", "RBR", "RBS", "RP", "SENT", "SYM", "TO", "UH", "VB", "VBD", "VBG", "VBN",
+        "VBP", "VBZ", "VH", "VHD", "VHG", "VHN", "VHP", "VHZ", "VV", "VVD", "VVG", "VVN", "VVP", "VVZ", "WDT",
+        "WP", "WP$", "WRB", ":", "$", "(", ")", "``", "''", ",", "#",
+    ],
+    "de": [
+        "ADJA", "ADJD", "ADV", "APPR", "APPRART", "APPO", "APZR", "ART", "CARD", "FM", "ITJ", "KOUI", "KOUS",
+        "KON", "KOKOM", "NN", "NE", "PDS", "PDAT", "PIS", "PIAT", "PIDAT", "PPER", "PPOSS", "PPOSAT", "PRELS",
+        "PRELAT", "PRF", "PWS", "PWAT", "PWAV", "PAV", "PTKZU", "PTKNEG", "PTKVZ", "PTKANT", "PTKA", "TRUNC",
+        "VVFIN", "VVIMP", "VVINF", "VVIZU", "VVPP", "VAFIN", "VAIMP", "VAINF", "VAPP", "VMFIN", "VMINF", "VMPP",
+        "XY", "$,", "$.", "$(",
+    ],
+    "es": [
+        "ACRNM", "ADJ", "ADV", "ALFP", "ALFS", "ART", "BACKSLASH", "CARD", "CC", "CCAD", "CCNEG", "CM", "CODE",
+        "COLON", "CQUE", "CSUBF", "CSUBI", "CSUBX", "DASH", "DM", "DOTS", "FO", "FS", "INT", "ITJN", "LP", "NC",
+        "NEG", "NMEA", "NMON", "NP", "ORD", "PAL", "PDEL", "PE", "PERCT", "PNC", "PPC", "PPO", "PPX", "PREP",
+        "QT", "QU", "REL", "RP", "SE", "SEMICOLON", "SLASH", "SYM", "UMMX", "VCLIger", "VCLIinf", "VCLIfin",
+        "VEadj", "VEfin", "VEger", "VEinf", "VHadj", "VHfin", "VHger", "VHinf", "VLadj", "VLfin", "VLger",
+        "VLinf", "VMadj", "VMfin", "VMger", "VMinf", "VSadj", "VSfin", "VSger", "VSinf",
+    ],
+    "nl": [
+        "$.", "adj", "adj*kon", "adjabbr", "adv", "advabbr", "conjcoord", "conjsubo", "det__art", "det__demo",
+        "det__indef", "det__poss", "det__quest", "det__rel", "int", "noun*kop", "nounabbr", "nounpl",
+        "nounprop", "nounsg", "num__card", "num__ord", "partte", "prep", "prepabbr", "pronadv", "prondemo",
+        "pronindef", "pronpers", "pronposs", "pronquest", "pronrefl", "pronrel", "punc", "verbinf", "verbpapa",
+        "verbpastpl", "verbpastsg", "verbpresp", "verbprespl", "verbpressg",
+    ],
+    "fr": [
+        "ABR", "ADJ", "ADV", "DET:ART", "DET:POS", "INT", "KON", "NAM", "NOM", "NUM", "PRO", "PRO:DEM", "PRO:IND",
+        "PRO:PER", "PRO:POS", "PRO:REL", "PRP", "PRP:det", "PUN", "PUN:cit", "SENT", "SYM", "VER:cond",
+        "VER:futu", "VER:impe", "VER:impf", "VER:infi", "VER:pper", "VER:ppre", "VER:pres", "VER:simp",
+        "VER:subi", "VER:subp",
+    ],
+    "it": [
+        "ABR", "ADJ", "ADV", "CON", "DET:def", "DET:indef", "FW", "INT", "LS", "NOM", "NPR", "NUM", "PON", "PRE",
+        "PRE:det", "PRO", "PRO:demo", "PRO:indef", "PRO:inter", "PRO:pers", "PRO:poss", "PRO:refl", "PRO:rela",
+        "SENT", "SYM", "VER:cimp", "VER:cond", "VER:cpre", "VER:futu", "VER:geru", "VER:impe", "VER:impf",
+        "VER:infi", "VER:pper", "VER:ppre", "VER:pres", "VER:refl:infi", "VER:remo",
+    ],
+}
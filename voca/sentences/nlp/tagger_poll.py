@@ -0,0 +1,254 @@
+import atexit
+import collections
+import logging
+import threading
+import time
+from django.conf import settings
+from django.utils.functional import cached_property
+from .treetaggerwrapper import MultiplexTreeTagger, TreeTagger, TreeTaggerError
+from .treetaggerwrapper.treetaggerwrapper import TAGGER_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAGGER_POLL = {
+    # Languages which always keep warm taggers, others get taggers on first use
+    "LANGUAGES": ["de", "en", "es", "fr", "it", "nl"],
+    # Idle (or, with TAGGER_MULTIPLEX, not busy) taggers kept started per language
+    "MIN_SPARES": 1,
+    "MAX_SIZE": 4,
+    # Seconds a spare tagger may stay unused before it is stopped
+    "IDLE_TIMEOUT": 300,
+    # Average seconds callers waited for a tagger above which one is added
+    "SCALE_UP_WAIT": 0.05,
+    # Texts in flight on a multiplexed tagger above which one is added
+    "MULTIPLEX_DEPTH": 8,
+    # Seconds between two health checks / resizing of the poll
+    "INTERVAL": 5,
+}
+
+
+# Taggers of one language. Each text checks out an idle tagger, or, with TAGGER_MULTIPLEX,
+# goes to the least busy multiplexed tagger.
+class LanguageTaggers:
+    def __init__(self, lang, config, multiplex):
+        self.lang = lang
+        self.config = config
+        self.multiplex = multiplex
+        self.taggers = []
+        self.idle = []
+        self.last_used = {}
+        # Callers (or warm-ups) using each tagger, which maintain never stops
+        self.busy = collections.Counter()
+        self.waiting = 0
+        self.requests = 0
+        self.restarts = 0
+        self.wait_times = collections.deque(maxlen=100)
+        self.tag_times = collections.deque(maxlen=100)
+        self.condition = threading.Condition()
+
+    def tag_text(self, text, **kwargs):
+        requested = time.monotonic()
+        tagger = self.__acquire()
+        started = time.monotonic()
+        try:
+            result = tagger.tag_text(text, **kwargs)
+        except (TreeTaggerError, OSError):
+            self.__release(tagger, failed=True)
+            raise
+        except BaseException:
+            self.__release(tagger)
+            raise
+        self.__release(tagger)
+        with self.condition:
+            self.requests += 1
+            self.wait_times.append(started - requested)
+            self.tag_times.append(time.monotonic() - started)
+        return result
+
+    def maintain(self):
+        with self.condition:
+            now = time.monotonic()
+            for tagger in [t for t in self.__spares() if not t.is_alive()]:
+                self.__remove(tagger)
+                self.restarts += 1
+            spares = sorted(self.__spares(), key=lambda t: self.last_used.get(t, now))
+            while len(spares) > self.config["MIN_SPARES"] \
+                    and now - self.last_used.get(spares[0], now) > self.config["IDLE_TIMEOUT"]:
+                self.__remove(spares.pop(0))
+            missing = self.config["MIN_SPARES"] - len(spares)
+            if self.wait_times and sum(self.wait_times) / len(self.wait_times) > self.config["SCALE_UP_WAIT"]:
+                missing = max(missing, 1)
+                self.wait_times.clear()
+            missing = min(missing, self.config["MAX_SIZE"] - len(self.taggers))
+            new_taggers = [self.__spawn() for _ in range(missing)]
+        for tagger in new_taggers:
+            self.__warm(tagger)
+
+    def metrics(self):
+        with self.condition:
+            return {
+                "size": len(self.taggers),
+                "spares": len(self.__spares()),
+                "waiting": self.waiting,
+                "pending": sum(t.pending_count() for t in self.taggers) if self.multiplex else None,
+                "requests": self.requests,
+                "restarts": self.restarts,
+                "avg_wait_ms": self.__average_ms(self.wait_times),
+                "avg_tag_ms": self.__average_ms(self.tag_times),
+            }
+
+    def close(self):
+        with self.condition:
+            for tagger in list(self.taggers):
+                self.__remove(tagger)
+
+    def __acquire(self):
+        with self.condition:
+            if self.multiplex:
+                tagger = min(self.taggers, key=lambda t: t.pending_count(), default=None)
+                if tagger is None or (tagger.pending_count() >= self.config["MULTIPLEX_DEPTH"]
+                                      and len(self.taggers) < self.config["MAX_SIZE"]):
+                    return self.__spawn()
+                self.busy[tagger] += 1
+                return tagger
+            self.waiting += 1
+            try:
+                while True:
+                    while not self.idle:
+                        if len(self.taggers) < self.config["MAX_SIZE"]:
+                            return self.__spawn()
+                        if not self.condition.wait(TAGGER_TIMEOUT):
+                            raise TreeTaggerError(f"No tagger available for language {self.lang}.")
+                    tagger = self.idle.pop()
+                    # A tagger which died while idle is replaced rather than handed out
+                    if tagger.is_alive():
+                        self.busy[tagger] += 1
+                        return tagger
+                    self.__remove(tagger)
+                    self.restarts += 1
+            finally:
+                self.waiting -= 1
+
+    def __release(self, tagger, failed=False):
+        with self.condition:
+            self.busy[tagger] -= 1
+            if self.busy[tagger] <= 0:
+                del self.busy[tagger]
+            if tagger not in self.taggers:
+                # Removed by close() while in use
+                tagger.close()
+            elif failed and not (self.multiplex and tagger.is_alive()):
+                # The pipe may be left mid-text, replace the tagger
+                self.__remove(tagger)
+                self.restarts += 1
+            else:
+                self.last_used[tagger] = time.monotonic()
+                if not self.multiplex:
+                    self.idle.append(tagger)
+            self.condition.notify()
+
+    def __warm(self, tagger):
+        # Start the process and load the parameter file before a request needs it
+        try:
+            tagger.tag_text(".", tagonly=True)
+        except (TreeTaggerError, OSError):
+            logger.exception("Failed to start a %s tagger.", self.lang)
+            with self.condition:
+                self.__remove(tagger)
+            return
+        self.__release(tagger)
+
+    def __spawn(self):
+        tagger = MultiplexTreeTagger(TAGLANG=self.lang) if self.multiplex else TreeTagger(TAGLANG=self.lang)
+        self.taggers.append(tagger)
+        self.busy[tagger] += 1
+        return tagger
+
+    def __remove(self, tagger):
+        tagger.close()
+        if tagger in self.idle:
+            self.idle.remove(tagger)
+        if tagger in self.taggers:
+            self.taggers.remove(tagger)
+        self.last_used.pop(tagger, None)
+        self.busy.pop(tagger, None)
+
+    def __spares(self):
+        if self.multiplex:
+            return [t for t in self.taggers if t not in self.busy and t.pending_count() == 0]
+        return [t for t in self.idle if t not in self.busy]
+
+    @staticmethod
+    def __average_ms(times):
+        return round(1000 * sum(times) / len(times), 3) if times else None
+
+
+# Process-wide TreeTaggers for all languages, resized in the background from load
+class AdaptiveTaggerPoll:
+    def __init__(self):
+        self.languages = {}
+        self.preprocessors = {}
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.monitor = None
+
+    @cached_property
+    def config(self):
+        return {**DEFAULT_TAGGER_POLL, **getattr(settings, "TAGGER_POLL", {})}
+
+    def tag_text(self, lang, text, **kwargs):
+        return self.__language(lang).tag_text(text, **kwargs)
+
+    def preprocessor(self, lang):
+        # Tagger only used for text preparation, its process is never started
+        with self.lock:
+            if lang not in self.preprocessors:
+                self.preprocessors[lang] = TreeTagger(TAGLANG=lang)
+            return self.preprocessors[lang]
+
+    def metrics(self):
+        with self.lock:
+            languages = dict(self.languages)
+        return {lang: taggers.metrics() for lang, taggers in languages.items()}
+
+    def close(self):
+        self.stopping.set()
+        if self.monitor is not None:
+            self.monitor.join()
+        with self.lock:
+            languages = list(self.languages.values())
+            self.languages = {}
+        for taggers in languages:
+            taggers.close()
+
+    def __language(self, lang):
+        with self.lock:
+            if self.monitor is None:
+                # Started on first use, so that taggers are never created before a pre-fork
+                for enabled in self.config["LANGUAGES"]:
+                    self.__add_language(enabled)
+                self.monitor = threading.Thread(target=self.__monitor_main, daemon=True)
+                self.monitor.start()
+            if lang not in self.languages:
+                self.__add_language(lang)
+            return self.languages[lang]
+
+    def __add_language(self, lang):
+        multiplex = getattr(settings, "TAGGER_MULTIPLEX", False)
+        self.languages[lang] = LanguageTaggers(lang, self.config, multiplex)
+
+    def __monitor_main(self):
+        while True:
+            with self.lock:
+                languages = list(self.languages.values())
+            for taggers in languages:
+                try:
+                    taggers.maintain()
+                except Exception:
+                    logger.exception("Failed to maintain %s taggers.", taggers.lang)
+            if self.stopping.wait(self.config["INTERVAL"]):
+                break
+
+
+tagger_poll = AdaptiveTaggerPoll()
+atexit.register(tagger_poll.close)
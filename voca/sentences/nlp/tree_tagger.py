@@ -1,28 +1,110 @@
+import collections
+import logging
 import operator
 import re
-from .treetaggerwrapper import TreeTagger, make_tags
-from .pos_patterns import pos_patterns
+from .cache import tag_cache
+from .lexicon import stored_probabilities
+from .tagger_poll import tagger_poll
+from .treetaggerwrapper import TreeTaggerError, is_sgml_tag, make_tags
+from .pos_patterns import pos_patterns, pos_tagsets
+
+logger = logging.getLogger(__name__)
 
 PROBA_THRESHOLD = 0.1
+# Token sent after each word of a batch so every word is tagged as if sent alone
+SENTENCE_END = "."
+UNKNOWN_POS = ("Unknown type", "unk", None)
+
+PosInfo = collections.namedtuple("PosInfo", ["tag_info", "is_noun", "is_verb", "is_adj"])
+
+
+# Classification of the tags of one language, looked up instead of matching each pattern
+# in turn. Tags missing from the tagset are matched once against all patterns combined.
+class PosTable:
+    def __init__(self, lang):
+        self.lang = lang
+        self.patterns = pos_patterns[lang]
+        # First pattern matching wins, like the list order. Group i holds pattern i.
+        self.matcher = re.compile("|".join(f"(?P<p{i}>{pattern})"
+                                           for i, (_, _, pattern) in enumerate(self.patterns)))
+        self.tags = {pos: self.__classify(pos) for pos in pos_tagsets.get(lang, [])}
+
+    def info(self, pos):
+        info = self.tags.get(pos)
+        if info is None:
+            # The tagset of a parameter file is closed, so this stays small
+            info = self.tags[pos] = self.__classify(pos)
+        return info
+
+    def __classify(self, pos):
+        match = self.matcher.match(pos)
+        if match:
+            description, cat, _ = self.patterns[int(match.lastgroup[1:])]
+            tag_info = (description, cat, pos)
+        else:
+            tag_info = UNKNOWN_POS
+        return PosInfo(tag_info, self.__is_noun(pos), self.__is_verb(pos), self.__is_adj(pos))
+
+    def __is_noun(self, pos):
+        if self.lang in ["de", "es", "fr", "it", "en"]:
+            return pos[0] == "N"
+        elif self.lang == "nl":
+            return pos[0:4] == "noun"
+
+    def __is_verb(self, pos):
+        if self.lang in ["de", "es", "fr", "it"]:
+            return pos[0] == "V"
+        elif self.lang == "en":
+            return pos[0] == "V" or pos == "MD"
+        elif self.lang == "nl":
+            return pos[0] == "v"
+        return False
+
+    def __is_adj(self, pos):
+        if self.lang == "en":
+            return pos[0:2] == "JJ"
+        else:
+            return pos[0:3].lower() == "adj"
+        return False
+
+
+# Built once at startup for every language
+pos_tables = {lang: PosTable(lang) for lang in pos_patterns}
 
 
 class VocaTagger:
     def __init__(self, lang):
-        self.tagger = TreeTagger(TAGLANG=lang)
+        # Only used to split words into tokens, tagging goes through the tagger poll
+        self.tagger = tagger_poll.preprocessor(lang)
         self.pos_patterns = pos_patterns[lang]
+        self.pos_table = pos_tables[lang]
         self.probabilities = None
         self.lang = lang
 
     def tag_word(self, word, search_group=None, initial=False):
-        tag = make_tags(self.tagger.tag_text(word), allow_extra=True)[0]
-        return self.__most_likely_tag(tag.extra, search_group, initial)
+        return self.__word_tag(self.tag_words([word])[0], search_group, initial)
+
+    def tag_words(self, words, search_group=None, use_lexicon=True):
+        tokens = [self.first_token(word) for word in words]
+        cached = tag_cache.get_many(self.lang, tokens)
+        missing = list(dict.fromkeys(token for token in tokens if token not in cached))
+        if missing and use_lexicon:
+            missing = self.__from_lexicon(missing, stored_probabilities(self.lang, missing), cached)
+        if missing:
+            output = tagger_poll.tag_text(self.lang, self.__token_lines(missing), tagonly=True)
+            cached.update(self.__cache_tagged(missing, output))
+        return self.__words_probabilities(tokens, cached, search_group)
 
     def word_tag_info(self, word, search_group, initial):
         pos = self.tag_word(word, search_group, initial)
-        for description, cat, pattern in self.pos_patterns:
-            if re.match(pattern, pos):
-                return description, cat, pos
-        return "Unknown type", "unk", None
+        return self.pos_tag_info(pos)
+
+    def words_tag_info(self, words, search_group):
+        return [self.pos_tag_info(self.__most_likely_tag(probabilities, search_group))
+                for probabilities in self.tag_words(words)]
+
+    def pos_tag_info(self, pos):
+        return self.pos_table.info(pos).tag_info
 
     def is_noun(self, word, use_proba=True):
         pos = self.tag_word(word)
@@ -37,41 +119,65 @@ class VocaTagger:
         return self.pos_is_adj(pos)
 
     def pos_is_noun(self, pos):
-        if self.lang in ["de", "es", "fr", "it", "en"]:
-            return pos[0] == "N"
-        elif self.lang == "nl":
-            return pos[0:4] == "noun"
+        return self.pos_table.info(pos).is_noun
 
     def pos_is_verb(self, pos):
-        if self.lang in ["de", "es", "fr", "it"]:
-            return pos[0] == "V"
-        elif self.lang == "en":
-            return pos[0] == "V" or pos == "MD"
-        elif self.lang == "nl":
-            return pos[0] == "v"
-        return False
+        return self.pos_table.info(pos).is_verb
 
     def pos_is_adj(self, pos):
-        if self.lang == "en":
-            return pos[0:2] == "JJ"
-        else:
-            return pos[0:3].lower() == "adj"
-        return False
+        return self.pos_table.info(pos).is_adj
+
+    def first_token(self, word):
+        # Same chunking as a plain tag_text(word) call, of which only the first tag was used
+        tokens = [t for t in self.tagger.tag_text(word, prepronly=True) if not is_sgml_tag(t)]
+        if not tokens:
+            raise ValueError(f"Cannot tag {word!r}, it contains no token.")
+        return tokens[0]
 
-    def __most_likely_tag(self, tups, search_group, initial):
-        all_probabilities = self.__build_proba_dict(tups)
+    def __word_tag(self, all_probabilities, search_group, initial):
         if initial:
-            print(all_probabilities)
+            logger.debug("Tag probabilities of the search term: %s", all_probabilities)
             self.probabilities = all_probabilities
-        # If the search group exists and is verb, limit tag possibilities
+        return self.__most_likely_tag(all_probabilities, search_group)
+
+    def __words_probabilities(self, tokens, probabilities, search_group):
+        all_probabilities = [probabilities[token] for token in tokens]
+        return [self.__group_probabilities(p, search_group) or p for p in all_probabilities]
+
+    @staticmethod
+    def __token_lines(tokens):
+        lines = []
+        for token in tokens:
+            lines.extend([token, SENTENCE_END])
+        return lines
+
+    def __from_lexicon(self, tokens, stored, cached):
+        if stored:
+            tag_cache.set_many(self.lang, stored)
+            cached.update(stored)
+        return [token for token in tokens if token not in stored]
+
+    def __cache_tagged(self, tokens, output):
+        tags = make_tags(output, allow_extra=True)
+        if len(tags) != 2 * len(tokens):
+            raise TreeTaggerError(f"Expected {2 * len(tokens)} tags from TreeTagger, got {len(tags)}.")
+        tagged = {token: self.__build_proba_dict(tag.extra) for token, tag in zip(tokens, tags[0::2])}
+        tag_cache.set_many(self.lang, tagged)
+        return tagged
+
+    def __group_probabilities(self, all_probabilities, search_group):
+        # If the search group exists and is verb or noun, limit tag possibilities
         if search_group == "verb":
-            probabilities = {pos: proba for pos, proba in all_probabilities.items() if self.pos_is_verb(pos)}
+            return {pos: proba for pos, proba in all_probabilities.items() if self.pos_is_verb(pos)}
         elif search_group == "noun":
-            probabilities = {pos: proba for pos, proba in all_probabilities.items() if self.pos_is_noun(pos)}
-        try:
+            return {pos: proba for pos, proba in all_probabilities.items() if self.pos_is_noun(pos)}
+        return {}
+
+    def __most_likely_tag(self, all_probabilities, search_group):
+        probabilities = self.__group_probabilities(all_probabilities, search_group)
+        if probabilities:
             return max(probabilities.items(), key=operator.itemgetter(1))[0]
-        except (ValueError, UnboundLocalError):
-            return list(all_probabilities.keys())[0]
+        return list(all_probabilities.keys())[0]
 
     @staticmethod
     def __build_proba_dict(tups):
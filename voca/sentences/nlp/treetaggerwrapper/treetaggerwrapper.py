@@ -471,7 +471,7 @@ __version__ = '2.3'
 #       semantic groups of things in the expression but no submatch group
 #       corresponding in the match object.
 # ==============================================================================
-__all__ = ["TreeTaggerError", "TreeTagger", "Tag", "make_tags"]
+__all__ = ["TreeTaggerError", "TreeTagger", "MultiplexTreeTagger", "Tag", "make_tags", "is_sgml_tag"]
 
 import codecs
 import collections
@@ -489,6 +489,11 @@ from six.moves import queue
 import re
 import shlex
 import six
+try:
+    import selectors
+except ImportError:
+    # Python 2 - use the old readline based reading of tagger output.
+    selectors = None
 import string
 import subprocess
 import sys
@@ -522,6 +527,9 @@ logger.addHandler(logging.NullHandler())
 # (avoid to restart TreeTagger process each time)
 STARTOFTEXT = "<ttpw:start-text />"
 ENDOFTEXT = "<ttpw:end-text />"
+# Same, identifying each text when several are in the pipe (see MultiplexTreeTagger).
+STARTOFTEXTID = '<ttpw:start-text id="{}" />'
+ENDOFTEXTID = '<ttpw:end-text id="{}" />'
 # A tag to identify line numbers from source text.
 NUMBEROFLINE = '<ttpw:line num="{}" />'
 # And tags to identify location of whitespaces in source text.
@@ -555,6 +563,14 @@ REPLACED_DNS_TAG = '<repdns text="{}" />'
 # Timeout in case of problem with the tagger process (used when reading).
 TAGGER_TIMEOUT = 30
 
+# Size of reads on the tagger output pipe.
+READ_BUFFER_SIZE = 65536
+
+# Encoded texts up to this size are written directly by the tagging thread,
+# larger ones go through the tagger writer thread (the pipe buffer is much
+# bigger, so small writes never block waiting for the tagger to read).
+INLINE_WRITE_MAX = 4096
+
 # ==============================================================================
 # ALONEMARKS:
 #   chars which must be kept alone, they must have spaces around them to make
@@ -789,8 +805,10 @@ class FinalPart(object):
 
 
 # ==============================================================================
-def pipe_writer(pipe, text, flushsequence, encoding, errors):
-    """Write a text to a pipe and manage pre-post data to ensure flushing.
+def encode_for_pipe(text, flushsequence, encoding, errors,
+                    starttag=STARTOFTEXT, endtag=ENDOFTEXT):
+    """Build the bytes to write to TreeTagger for a text, with pre-post data
+    to ensure flushing.
 
     For internal use.
 
@@ -798,55 +816,134 @@ def pipe_writer(pipe, text, flushsequence, encoding, errors):
     ad-hoc encoding is providen by caller). If it is composed of unicode
     strings, then they are converted to the specified encoding.
 
-    :param  pipe: the Popen pipe on what to write the text.
-    :type   pipe: Popen object (file-like with write and flush methods)
     :param  text: the text to write.
     :type   text: string or list of strings
-    :param  flushsequence: lines of tokens to ensure flush by TreeTagger.
+    :param  flushsequence: lines of tokens to ensure flush by TreeTagger,
+                           None to let the caller write it.
     :type   flushsequence: string (with \\n between tokens)
     :param  encoding: encoding of texts written on the pipe.
     :type   encoding: str
     :param  errors: how to manage encoding errors: strict/ignore/replace.
     :type  errors: str
+    :param  starttag: SGML tag written before the text.
+    :type   starttag: str
+    :param  endtag: SGML tag written after the text.
+    :type   endtag: str
+    :return: data to write on the pipe.
+    :rtype: bytes
     """
-    try:
-        # Warn the user of possible bad usage.
-        if not text:
-            logger.warning("Requested to tag an empty text.")
-            # We continue to unlock the thread waiting for the ENDOFTEXT on
-            # TreeTagger output.
+    # Warn the user of possible bad usage.
+    if not text:
+        logger.warning("Requested to tag an empty text.")
+        # We continue to unlock the thread waiting for the ENDOFTEXT on
+        # TreeTagger output.
+
+    newline = "\n".encode(encoding, errors)
+    parts = [(starttag + "\n").encode(encoding, errors)]
+    if text:
+        if isinstance(text, six.string_types):
+            # Typically if called without pre-processing.
+            if isinstance(text, six.text_type):
+                text = text.encode(encoding, errors)
+            parts.append(text)
+            if not text.endswith(newline):
+                parts.append(newline)
+        else:
+            assert isinstance(text, list)
+            # Typically when we have done pre-processing.
+            for line in text:
+                if isinstance(line, six.text_type):
+                    line = line.encode(encoding, errors)
+                parts.append(line)
+                parts.append(newline)
+    # Note: ENDOFTEXT is a str - no encoding (basic ASCII).
+    parts.append((endtag + "\n.\n").encode(encoding, errors))
+    if flushsequence is not None:
+        parts.append((flushsequence + "\n").encode(encoding, errors))
+    return b"".join(parts)
 
-        logger.info("Writing starting part to pipe.")
-        pipe.write((STARTOFTEXT + "\n").encode(encoding, errors))
 
-        logger.info("Writing data to pipe.")
+# ==============================================================================
+def pipe_writer(pipe, text, flushsequence, encoding, errors):
+    """Write a text to a pipe and manage pre-post data to ensure flushing.
 
-        if text:
-            if isinstance(text, six.string_types):
-                # Typically if called without pre-processing.
-                if isinstance(text, six.text_type):
-                    text = text.encode(encoding, errors)
-                pipe.write(text)
-                if text[-1] != '\n':
-                    pipe.write("\n".encode(encoding, errors))
-            else:
-                assert isinstance(text, list)
-                # Typically when we have done pre-processing.
-                for line in text:
-                    if isinstance(line, six.text_type):
-                        line = line.encode(encoding, errors)
-                    pipe.write(line)
-                    pipe.write("\n".encode(encoding, errors))
-
-        logger.info("Writing ending and flushing part to pipe.")
-        # Note: ENDOFTEXT is a str - no encoding (basic ASCII).
-        pipe.write((ENDOFTEXT + "\n.\n" + flushsequence + "\n").encode(encoding, errors))
+    For internal use.
+
+    :param  pipe: the Popen pipe on what to write the text.
+    :type   pipe: Popen object (file-like with write and flush methods)
+    :param  text: the text to write, or data already built with
+                  :func:`encode_for_pipe`.
+    :type   text: string or list of strings or bytes
+
+    Other parameters are simply passed to :func:`encode_for_pipe`.
+    """
+    try:
+        if not isinstance(text, six.binary_type):
+            text = encode_for_pipe(text, flushsequence, encoding, errors)
+        logger.info("Writing data to pipe.")
+        pipe.write(text)
         pipe.flush()
         logger.info("Finished writing data to pipe. Pipe flushed.")
     except:
         logger.error("Failure during pipe writing.", exc_info=True)
 
 
+# ==============================================================================
+def pipe_writer_main(pipe, jobs):
+    """Write data to a pipe as long as they come in a queue.
+
+    For internal use, this is the main function of :class:`TreeTagger`
+    writer thread.
+
+    :param  pipe: the Popen pipe on what to write the data.
+    :type   pipe: Popen object (file-like with write and flush methods)
+    :param  jobs: queue of data built by :func:`encode_for_pipe`, None to
+                  stop the thread.
+    :type   jobs: queue.Queue
+    """
+    while True:
+        data = jobs.get()
+        if data is None:
+            break
+        pipe_writer(pipe, data, None, None, None)
+
+
+# ==============================================================================
+def multiplex_writer_main(pipe, jobs, flushdata):
+    """Write texts to a pipe as long as they come in a queue, flushing the
+    tagger once after all texts waiting in the queue.
+
+    For internal use, this is the main function of :class:`MultiplexTreeTagger`
+    writer thread.
+
+    :param  pipe: the Popen pipe on what to write the data.
+    :type   pipe: Popen object (file-like with write and flush methods)
+    :param  jobs: queue of data built by :func:`encode_for_pipe` without
+                  flush sequence, None to stop the thread.
+    :type   jobs: queue.Queue
+    :param  flushdata: encoded flush sequence.
+    :type   flushdata: bytes
+    """
+    stopping = False
+    while not stopping:
+        data = jobs.get()
+        if data is None:
+            break
+        parts = [data]
+        # Pipeline all texts already waiting, they share the flush sequence.
+        while True:
+            try:
+                data = jobs.get_nowait()
+            except queue.Empty:
+                break
+            if data is None:
+                stopping = True
+                break
+            parts.append(data)
+        parts.append(flushdata)
+        pipe_writer(pipe, b"".join(parts), None, None, None)
+
+
 # ==============================================================================
 class TreeTagger(object):
     """Wrap TreeTagger binary to optimize its usage on multiple texts.
@@ -938,6 +1035,16 @@ class TreeTagger(object):
     :type   tagoutput: read stream
     :ivar   taggerlock: synchronization tool for multuthread use of the object.
     :type   taggerlock: threading.Lock
+    :ivar   tagselector: selector to wait for TreeTagger output (None if
+                        selectors are not usable with pipes on the platform).
+    :type   tagselector: selectors.BaseSelector
+    :ivar   tagoutbuffer: data read from TreeTagger output after the end of
+                        the previous text (flush sequence tags).
+    :type   tagoutbuffer: bytes
+    :ivar   writerjobs: queue of data to write by the writer thread.
+    :type   writerjobs: queue.Queue
+    :ivar   writerthread: thread writing large texts to TreeTagger input.
+    :type   writerthread: threading.Thread
     :ivar   chunkerproc: external function for chunking.
     :type   chunkerproc: fct(tagger, ['text']) => ['chunk']
     """
@@ -1139,6 +1246,10 @@ class TreeTagger(object):
         self.tagpopen = None
         self.taginput = None
         self.tagoutput = None
+        self.tagselector = None
+        self.tagoutbuffer = b""
+        self.writerjobs = None
+        self.writerthread = None
 
     # -------------------------------------------------------------------------
     def _set_preprocessor(self, kargs):
@@ -1263,7 +1374,7 @@ class TreeTagger(object):
             # self.taginput,self.tagoutput = os.popen2(tagcmd)
             self.tagpopen = subprocess.Popen(
                 tagcmdlist,  # Use a list of params in place of a string.
-                bufsize=0,   # Not buffered to retrieve data asap from TreeTagger
+                bufsize=-1,  # Output is read directly from its file descriptor, see _read_tagged
                 executable=self.tagbin,  # As we have it, specify it
                 stdin=subprocess.PIPE,  # Get a pipe to write input data to TreeTagger process
                 stdout=subprocess.PIPE,  # Get a pipe to read processing results from TreeTagger
@@ -1278,6 +1389,10 @@ class TreeTagger(object):
                 # creationflags=0   unused
             )
             self.taginput, self.tagoutput = self.tagpopen.stdin, self.tagpopen.stdout
+            self.tagoutbuffer = b""
+            if selectors is not None and ON_POSIX:
+                self.tagselector = selectors.DefaultSelector()
+                self.tagselector.register(self.tagoutput.fileno(), selectors.EVENT_READ)
             logger.info("Started TreeTagger from command: %r", tagcmdlist)
         except:
             logger.error("Failure to start TreeTagger with: %r", \
@@ -1290,6 +1405,37 @@ class TreeTagger(object):
 
         Cut links with TreeTagger process.
         """
+        self.close()
+
+    # --------------------------------------------------------------------------
+    def is_alive(self):
+        """Check that the TreeTagger process is usable.
+
+        A wrapper whose process has not been started yet is considered alive,
+        the process will be started at first :meth:`tag_text` call.
+
+        :return: False if the TreeTagger process has exited.
+        :rtype: bool
+        """
+        if not getattr(self, "tagpopen", None):
+            return True
+        return self.tagpopen.poll() is None
+
+    # --------------------------------------------------------------------------
+    def close(self):
+        """Cut links with TreeTagger process and terminate it.
+
+        The wrapper can still be used after, a new TreeTagger process will
+        be started at next :meth:`tag_text` call.
+        """
+        if getattr(self, "writerthread", None):
+            self.writerjobs.put(None)
+            self.writerthread.join()
+            self.writerthread = None
+            self.writerjobs = None
+        if getattr(self, "tagselector", None):
+            self.tagselector.close()
+            self.tagselector = None
         if hasattr(self, "taginput") and self.taginput:
             self.taginput.close()
             self.taginput = None
@@ -1430,48 +1576,119 @@ class TreeTagger(object):
 
             # Send text to TreeTagger, get result.
             logger.debug("Tagging text.")
-            t = threading.Thread(target=pipe_writer,
-                                 args=(self.taginput,
-                                       lines, self.dummysequence,
-                                       self.taginencoding,
-                                       self.taginencerr))
-            t.start()
-
-            result = []
-            intext = False
-            lastline_time = time.time()
-            while True:
-                line = self.tagoutput.readline()
-                if DEBUG: logger.debug("Read from TreeTagger: %r", line)
-                if not line:
-                    if (time.time() - lastline_time) > TAGGER_TIMEOUT:
-                        # We already wait some times, there may be a problem with tagging
-                        # process communication. This avoid infinite loop.
-                        logger.error("Time out for TreeTagger reply.")
-                        raise TreeTaggerError("Time out for TreeTagger reply, enable debug / see error logs")
-                    else:
-                        # We process too much quickly, leave time for tagger and writer
-                        # thread to work.
-                        time.sleep(0.1)
-                        continue    # read again.
-                lastline_time = time.time()
-
-                line = line.decode(self.tagoutencoding, self.tagoutencerr)
-                line = line.strip()
-                if line == STARTOFTEXT:
-                    intext = True
-                    continue
-                if line == ENDOFTEXT:  # The flag we sent to identify texts.
-                    intext = False
-                    break
-                if intext and line:
-                    if not (self.removesgml and is_sgml_tag(line)):
-                        result.append(line)
+            data = encode_for_pipe(lines, self.dummysequence,
+                                   self.taginencoding, self.taginencerr)
+            if self.tagselector is not None and len(data) <= INLINE_WRITE_MAX:
+                self.taginput.write(data)
+                self.taginput.flush()
+            else:
+                self._start_writer()
+                self.writerjobs.put(data)
 
-            # Synchronize to avoid possible problems.
-            t.join()
+            if self.tagselector is not None:
+                return self._read_tagged()
+            else:
+                return self._read_tagged_lines()
 
-        return result
+    # --------------------------------------------------------------------------
+    def _start_writer(self):
+        """Start the thread writing texts to TreeTagger input, if not running.
+
+        Internal use.
+        """
+        if self.writerthread is None:
+            self.writerjobs = queue.Queue()
+            self.writerthread = threading.Thread(target=pipe_writer_main,
+                                                 args=(self.taginput, self.writerjobs))
+            self.writerthread.daemon = True
+            self.writerthread.start()
+
+    # --------------------------------------------------------------------------
+    def _process_output_line(self, line, state, result):
+        """Process one line of TreeTagger output for current text.
+
+        Internal use.
+
+        :return: True when the end of text has been reached.
+        :rtype: bool
+        """
+        if DEBUG: logger.debug("Read from TreeTagger: %r", line)
+        line = line.decode(self.tagoutencoding, self.tagoutencerr)
+        line = line.strip()
+        if line == STARTOFTEXT:
+            state["intext"] = True
+            return False
+        if line == ENDOFTEXT:  # The flag we sent to identify texts.
+            state["intext"] = False
+            return True
+        if state["intext"] and line:
+            if not (self.removesgml and is_sgml_tag(line)):
+                result.append(line)
+        return False
+
+    # --------------------------------------------------------------------------
+    def _read_tagged(self):
+        """Read TreeTagger output for current text, up to the ENDOFTEXT tag.
+
+        Internal use.
+
+        Output is read by large blocks when the selector signals it is
+        available, and splitted into lines here. Data following the
+        ENDOFTEXT tag is kept for next call.
+
+        :return: List of output strings from the tagger.
+        :rtype:  [ str ]
+        """
+        result = []
+        state = {"intext": False}
+        fd = self.tagoutput.fileno()
+        buffer = self.tagoutbuffer
+        while True:
+            lines = buffer.split(b"\n")
+            buffer = lines.pop()
+            for i, line in enumerate(lines):
+                if self._process_output_line(line, state, result):
+                    self.tagoutbuffer = b"\n".join(lines[i + 1:] + [buffer])
+                    return result
+            if not self.tagselector.select(TAGGER_TIMEOUT):
+                # There may be a problem with tagging process communication.
+                # This avoid infinite wait.
+                logger.error("Time out for TreeTagger reply.")
+                raise TreeTaggerError("Time out for TreeTagger reply, enable debug / see error logs")
+            data = os.read(fd, READ_BUFFER_SIZE)
+            if not data:
+                logger.error("TreeTagger output closed.")
+                raise TreeTaggerError("TreeTagger output closed, enable debug / see error logs")
+            buffer += data
+
+    # --------------------------------------------------------------------------
+    def _read_tagged_lines(self):
+        """Read TreeTagger output for current text, line by line.
+
+        Internal use, when selectors cannot be used on pipes.
+
+        :return: List of output strings from the tagger.
+        :rtype:  [ str ]
+        """
+        result = []
+        state = {"intext": False}
+        lastline_time = time.time()
+        while True:
+            line = self.tagoutput.readline()
+            if not line:
+                if (time.time() - lastline_time) > TAGGER_TIMEOUT:
+                    # We already wait some times, there may be a problem with tagging
+                    # process communication. This avoid infinite loop.
+                    logger.error("Time out for TreeTagger reply.")
+                    raise TreeTaggerError("Time out for TreeTagger reply, enable debug / see error logs")
+                else:
+                    # We process too much quickly, leave time for tagger and writer
+                    # thread to work.
+                    time.sleep(0.1)
+                    continue    # read again.
+            lastline_time = time.time()
+            if self._process_output_line(line, state, result):
+                return result
 
     # --------------------------------------------------------------------------
     def tag_file(self, infilepath, encoding=USER_ENCODING,
@@ -2447,6 +2664,205 @@ def make_tags(result, exclude_nottags=False, allow_extra=False):
     return newres
 
 
+# ==============================================================================
+MULTIPLEXTAG_re = re.compile(r'^<ttpw:(start|end)-text id="(\d+)" />$')
+
+
+class MultiplexTreeTagger(TreeTagger):
+    """TreeTagger wrapper allowing several texts in the TreeTagger pipe at once.
+
+    :class:`TreeTagger` processes one text at a time: a thread calling
+    :meth:`TreeTagger.tag_text` holds the tagger until the whole result has
+    been read back. Here each text is framed with its own numbered SGML
+    tags and written as soon as it is submitted; a reader thread routes
+    the tagger output back to the waiting callers. Texts waiting to be
+    written together share a single flush sequence.
+
+    Same interface as :class:`TreeTagger`, plus :meth:`tag_text_async`.
+
+    If you want to **properly terminate** a :class:`MultiplexTreeTagger`,
+    you must call its :meth:`close` method (it stops its threads).
+    """
+    # --------------------------------------------------------------------------
+    def __init__(self, **kargs):
+        TreeTagger.__init__(self, **kargs)
+        self.pending = {}
+        self.lasttextid = 0
+        self.readerthread = None
+
+    # --------------------------------------------------------------------------
+    def tag_text(self, text, numlines=False, tagonly=False,
+                 prepronly=False, tagblanks=False, notagurl=False,
+                 notagemail=False, notagip=False, notagdns=False,
+                 nosgmlsplit=False):
+        """See :meth:`TreeTagger.tag_text`.
+
+        Wait for the text result, while other threads may have their texts
+        processed by the same TreeTagger process.
+        """
+        lines = TreeTagger.tag_text(self, text, numlines=numlines, tagonly=tagonly,
+                                    prepronly=True, tagblanks=tagblanks, notagurl=notagurl,
+                                    notagemail=notagemail, notagip=notagip, notagdns=notagdns,
+                                    nosgmlsplit=nosgmlsplit)
+        if prepronly:
+            return lines
+        return self.tag_lines_async(lines).wait()
+
+    # --------------------------------------------------------------------------
+    def tag_text_async(self, text, numlines=False, tagonly=False,
+                       tagblanks=False, notagurl=False,
+                       notagemail=False, notagip=False, notagdns=False,
+                       nosgmlsplit=False):
+        """Submit a text to tag without waiting for its result.
+
+        See :meth:`TreeTagger.tag_text` for parameters.
+
+        :return: request object, call its ``wait()`` method to get result.
+        :rtype: :class:`MultiplexRequest`
+        """
+        lines = TreeTagger.tag_text(self, text, numlines=numlines, tagonly=tagonly,
+                                    prepronly=True, tagblanks=tagblanks, notagurl=notagurl,
+                                    notagemail=notagemail, notagip=notagip, notagdns=notagdns,
+                                    nosgmlsplit=nosgmlsplit)
+        return self.tag_lines_async(lines)
+
+    # --------------------------------------------------------------------------
+    def tag_lines_async(self, lines):
+        """Submit already prepared lines (one token by line) to TreeTagger.
+
+        :param lines: TreeTagger input lines.
+        :type lines: [ unicode ]
+        :return: request object, call its ``wait()`` method to get result.
+        :rtype: :class:`MultiplexRequest`
+        """
+        with self.taggerlock:
+            if self.taginput is None or not self.is_alive():
+                self._start_multiplex()
+            self.lasttextid += 1
+            request = MultiplexRequest(self, self.lasttextid)
+            self.pending[request.textid] = request
+            self.writerjobs.put(encode_for_pipe(lines, None,
+                                                self.taginencoding, self.taginencerr,
+                                                STARTOFTEXTID.format(request.textid),
+                                                ENDOFTEXTID.format(request.textid)))
+        return request
+
+    # --------------------------------------------------------------------------
+    def pending_count(self):
+        """Number of texts submitted and not yet tagged.
+        """
+        return len(self.pending)
+
+    # --------------------------------------------------------------------------
+    def close(self):
+        """See :meth:`TreeTagger.close`.
+
+        Also stop the reader thread, texts still waiting for their result
+        get an error.
+        """
+        if getattr(self, "tagpopen", None):
+            # Tagger exit closes its output, which ends the reader thread.
+            self.tagpopen.terminate()
+        if getattr(self, "readerthread", None):
+            self.readerthread.join()
+            self.readerthread = None
+        TreeTagger.close(self)
+
+    # --------------------------------------------------------------------------
+    def _start_multiplex(self):
+        """Start TreeTagger process, and threads to write and read its pipes.
+
+        Internal use.
+        """
+        if self.taginput is not None:
+            # Process died, cleanup before restarting.
+            self.close()
+        self._start_process()
+        self.writerjobs = queue.Queue()
+        flushdata = (self.dummysequence + "\n").encode(self.taginencoding, self.taginencerr)
+        self.writerthread = threading.Thread(target=multiplex_writer_main,
+                                             args=(self.taginput, self.writerjobs, flushdata))
+        self.writerthread.daemon = True
+        self.writerthread.start()
+        self.readerthread = threading.Thread(target=self._reader_main,
+                                             args=(self.tagoutput.fileno(),))
+        self.readerthread.daemon = True
+        self.readerthread.start()
+
+    # --------------------------------------------------------------------------
+    def _reader_main(self, fd):
+        """Read TreeTagger output and dispatch it to waiting requests.
+
+        Internal use, main function of the reader thread.
+        """
+        current = None
+        buffer = b""
+        try:
+            while True:
+                data = os.read(fd, READ_BUFFER_SIZE)
+                if not data:
+                    break
+                lines = (buffer + data).split(b"\n")
+                buffer = lines.pop()
+                for line in lines:
+                    if DEBUG: logger.debug("Read from TreeTagger: %r", line)
+                    line = line.decode(self.tagoutencoding, self.tagoutencerr).strip()
+                    match = MULTIPLEXTAG_re.match(line)
+                    if match is not None:
+                        textid = int(match.group(2))
+                        if match.group(1) == "start":
+                            current = self.pending.get(textid)
+                        else:
+                            request = self.pending.pop(textid, None)
+                            if request is not None:
+                                request._finish()
+                            current = None
+                    elif current is not None and line:
+                        if not (self.removesgml and is_sgml_tag(line)):
+                            current.result.append(line)
+        except (OSError, ValueError):
+            logger.error("Failure during pipe reading.", exc_info=True)
+        finally:
+            logger.info("TreeTagger output closed, failing %d pending texts.",
+                        len(self.pending))
+            for textid in list(self.pending):
+                request = self.pending.pop(textid, None)
+                if request is not None:
+                    request._finish(TreeTaggerError("TreeTagger output closed."))
+
+
+class MultiplexRequest(object):
+    """A text submitted to a :class:`MultiplexTreeTagger`.
+
+    :ivar textid: number of the text in the tagger flow.
+    :ivar result: TreeTagger output lines for the text.
+    """
+    def __init__(self, tagger, textid):
+        self._tagger = tagger
+        self.textid = textid
+        self.result = []
+        self._error = None
+        self._event = threading.Event()
+
+    def _finish(self, error=None):
+        self._error = error
+        self._event.set()
+
+    def wait(self, timeout=TAGGER_TIMEOUT):
+        """Wait for the text to be tagged.
+
+        :return: List of output strings from the tagger.
+        :rtype:  [ str ]
+        """
+        if not self._event.wait(timeout):
+            self._tagger.pending.pop(self.textid, None)
+            logger.error("Time out for TreeTagger reply.")
+            raise TreeTaggerError("Time out for TreeTagger reply, enable debug / see error logs")
+        if self._error is not None:
+            raise self._error
+        return self.result
+
+
 # ==============================================================================
 class TaggerPoll(object):
     """Keep a poll of TreeTaggers for processing with different threads.
@@ -0,0 +1,111 @@
+import atexit
+import logging
+import threading
+from collections import Counter
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils.functional import cached_property
+from .detail import sentence_cache
+from .models import Sentence
+
+logger = logging.getLogger(__name__)
+
+# Sentences with more reports are left out of searches
+MAX_REPORTS = 3
+
+DEFAULT_REPORT_BUFFER = {
+    # Seconds between flushes, None to write every report at once
+    "FLUSH_INTERVAL": 5,
+    # Distinct sentences pending before a flush is done without waiting
+    "MAX_PENDING": 1000,
+}
+
+
+# Write-behind counter of reports per sentence ref_id. Pending reports are written as one
+# UPDATE per distinct increment in a single transaction, so reports no longer take the
+# database write lock each, and concurrent reports of a sentence add up instead of racing.
+# Reports still pending when the process dies are lost.
+class ReportBuffer:
+    def __init__(self):
+        self.pending = Counter()
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopping = threading.Event()
+        self.flusher = None
+
+    @cached_property
+    def config(self):
+        return {**DEFAULT_REPORT_BUFFER, **getattr(settings, "REPORT_BUFFER", {})}
+
+    def add(self, ref_id):
+        if self.config["FLUSH_INTERVAL"] is None:
+            with self.lock:
+                self.pending[ref_id] += 1
+            self.flush()
+            return
+        with self.lock:
+            self.pending[ref_id] += 1
+            full = len(self.pending) >= self.config["MAX_PENDING"]
+            if self.flusher is None:
+                # Started on first use, so that no thread is created before a pre-fork
+                self.flusher = threading.Thread(target=self.__flusher_main, name="report-flush", daemon=True)
+                self.flusher.start()
+        if full:
+            self.wakeup.set()
+
+    def flush(self):
+        with self.flush_lock:
+            with self.lock:
+                pending, self.pending = self.pending, Counter()
+            if not pending:
+                return 0
+            try:
+                hidden = self.__write(pending)
+            except Exception:
+                # Put them back for the next flush
+                with self.lock:
+                    self.pending.update(pending)
+                raise
+        for ref_id in pending:
+            sentence_cache.evict(ref_id)
+        if hidden:
+            logger.info("%s sentences reported more than %s times.", len(hidden), MAX_REPORTS)
+        return len(pending)
+
+    def close(self):
+        self.stopping.set()
+        self.wakeup.set()
+        if self.flusher is not None:
+            self.flusher.join()
+        self.flush()
+
+    @staticmethod
+    def __write(pending):
+        by_increment = {}
+        for ref_id, count in pending.items():
+            by_increment.setdefault(count, []).append(ref_id)
+        with transaction.atomic():
+            before = dict(Sentence.objects.filter(ref_id__in=list(pending)).values_list("ref_id", "reports"))
+            for count, ref_ids in by_increment.items():
+                Sentence.objects.filter(ref_id__in=ref_ids).update(reports=F("reports") + count)
+        # Sentences this flush takes past the search threshold
+        return [ref_id for ref_id, reports in before.items()
+                if reports <= MAX_REPORTS < reports + pending[ref_id]]
+
+    def __flusher_main(self):
+        try:
+            while not self.stopping.is_set():
+                self.wakeup.wait(self.config["FLUSH_INTERVAL"])
+                self.wakeup.clear()
+                try:
+                    self.flush()
+                except Exception:
+                    logger.exception("Failed to flush sentence reports.")
+        finally:
+            connection.close()
+
+
+report_buffer = ReportBuffer()
+atexit.register(report_buffer.close)
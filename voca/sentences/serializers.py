@@ -1,6 +1,8 @@
 from django.contrib.auth.models import User
 from rest_framework import serializers
+from .fields import Category
 from .models import Sentence
+from .translation import TRANSLATION_LANGUAGES
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -20,8 +22,30 @@ class SentenceSerializer(serializers.Serializer):
     reports = serializers.IntegerField()
     avg_word_length = serializers.FloatField()
     language = serializers.CharField()
-    id = serializers.UUIDField()
+    id = serializers.UUIDField(source="ref_id")
     category = serializers.CharField()
 
     def create(self, validated_data):
         return Sentence.objects.create(**validated_data)
+
+
+class TranslationSerializer(serializers.Serializer):
+    sentence = serializers.CharField(max_length=1000)
+    target_lang = serializers.ChoiceField(choices=TRANSLATION_LANGUAGES)
+    source_lang = serializers.ChoiceField(choices=TRANSLATION_LANGUAGES, required=False, allow_null=True)
+
+
+class BlankableIntegerField(serializers.IntegerField):
+    # The search options send "" for any value
+    def validate_empty_values(self, data):
+        return super().validate_empty_values(None if data == "" else data)
+
+
+class SentenceFilterSerializer(serializers.Serializer):
+    difficulty = BlankableIntegerField(required=False, allow_null=True)
+    category = serializers.ChoiceField(choices=Category.choices, required=False, allow_blank=True, allow_null=True)
+
+
+class SentenceBatchSerializer(SentenceFilterSerializer):
+    forms = serializers.ListField(child=serializers.CharField(max_length=255, trim_whitespace=False),
+                                  min_length=1, max_length=50)
@@ -0,0 +1,3 @@
+from .backends import *
+from .dispatcher import *
+from .translator import *
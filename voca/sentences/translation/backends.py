@@ -0,0 +1,33 @@
+import time
+
+
+# Translates lists of texts. Backends are set by TRANSLATION["BACKEND"] and built with the
+# keyword arguments of TRANSLATION["OPTIONS"].
+class TranslationBackend:
+    def translate(self, texts, target, source=None):
+        """Returns the translations of texts, in order."""
+        raise NotImplementedError()
+
+
+class GoogleBackend(TranslationBackend):
+    def __init__(self):
+        # Imported here so that other backends work without the Google client and credentials
+        from google.cloud import translate_v2 as translate
+        self.client = translate.Client()
+
+    def translate(self, texts, target, source=None):
+        results = self.client.translate(list(texts), target_language=target, source_language=source)
+        return [result["translatedText"] for result in results]
+
+
+# Offline stand-in for benchmarks and development, which waits latency seconds per call
+class FakeBackend(TranslationBackend):
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def translate(self, texts, target, source=None):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return [f"[{source or 'auto'}->{target}] {text}" for text in texts]
@@ -0,0 +1,93 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+# Texts of concurrent requests waiting for the same (target, source) call
+class PendingBatch:
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.texts = []
+
+
+# Sends the translations asked by concurrent requests as multi-text backend calls. While no
+# call is in flight texts are sent at once; under load they are collected for up to window
+# seconds per (target, source). Identical texts already on their way wait for the same call
+# (including callers arriving after an earlier one gave up on it), and at most
+# max_concurrency calls are made at once.
+class TranslationDispatcher:
+    def __init__(self, backend, window=0.01, max_batch=50, max_concurrency=4, timeout=30):
+        self.backend = backend
+        self.window = window
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_concurrency, thread_name_prefix="translate")
+        self.inflight = {}
+        self.pending = {}
+        self.condition = threading.Condition()
+        self.dispatcher = None
+        self.active = 0
+        self.calls = 0
+
+    def translate(self, texts, target, source=None):
+        futures = {text: self.__submit(text, target, source) for text in dict.fromkeys(texts)}
+        deadline = time.monotonic() + self.timeout
+        # Raises concurrent.futures.TimeoutError; the call goes on and its texts stay in
+        # flight until it returns
+        results = {text: future.result(timeout=max(deadline - time.monotonic(), 0))
+                   for text, future in futures.items()}
+        return [results[text] for text in texts]
+
+    def __submit(self, text, target, source):
+        with self.condition:
+            future = self.inflight.get((text, target, source))
+            if future is None:
+                future = self.inflight[(text, target, source)] = Future()
+                batch = self.pending.get((target, source))
+                if batch is None:
+                    batch = self.pending[(target, source)] = PendingBatch(time.monotonic() + self.window)
+                batch.texts.append(text)
+                if self.dispatcher is None:
+                    # Started on first use, so that no thread is created before a pre-fork
+                    self.dispatcher = threading.Thread(target=self.__dispatcher_main, name="translate-dispatch",
+                                                       daemon=True)
+                    self.dispatcher.start()
+                self.condition.notify()
+        return future
+
+    def __dispatcher_main(self):
+        while True:
+            with self.condition:
+                now = time.monotonic()
+                ready = [key for key, batch in self.pending.items()
+                         if self.active == 0 or batch.deadline <= now or len(batch.texts) >= self.max_batch]
+                if not ready:
+                    deadlines = [batch.deadline for batch in self.pending.values()]
+                    self.condition.wait(min(deadlines) - now if deadlines else None)
+                    continue
+                calls = []
+                for key in ready:
+                    texts = self.pending.pop(key).texts
+                    calls += [(key, texts[i:i + self.max_batch]) for i in range(0, len(texts), self.max_batch)]
+                self.active += len(calls)
+            for (target, source), texts in calls:
+                self.executor.submit(self.__send, texts, target, source)
+
+    def __send(self, texts, target, source):
+        with self.condition:
+            self.calls += 1
+        try:
+            results, error = self.backend.translate(texts, target, source), None
+            if len(results) != len(texts):
+                raise ValueError(f"Expected {len(texts)} translations, got {len(results)}.")
+        except Exception as e:
+            results, error = None, e
+        with self.condition:
+            futures = [self.inflight.pop((text, target, source)) for text in texts]
+            self.active -= 1
+            self.condition.notify()
+        for i, future in enumerate(futures):
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(results[i])
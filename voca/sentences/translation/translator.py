@@ -0,0 +1,84 @@
+import hashlib
+from concurrent.futures import TimeoutError
+from django.conf import settings
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+from rest_framework.exceptions import APIException
+from ..models import Translation
+from .dispatcher import TranslationDispatcher
+
+# Languages texts are translated from and to, those of the word search
+TRANSLATION_LANGUAGES = ["de", "en", "es", "fr", "it", "nl"]
+
+DEFAULT_TRANSLATION = {
+    "BACKEND": "sentences.translation.backends.GoogleBackend",
+    "OPTIONS": {},
+    # Most seconds concurrent requests are collected into one backend call, while others are
+    # in flight
+    "BATCH_WINDOW": 0.01,
+    "MAX_BATCH": 50,
+    # Backend calls at once per process
+    "MAX_CONCURRENCY": 4,
+    # Seconds a request waits for its translation
+    "TIMEOUT": 30,
+}
+
+
+class TranslationUnavailable(APIException):
+    status_code = 503
+    default_detail = "The translation service did not answer in time, try again later."
+    default_code = "translation_unavailable"
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Translations are stored in the Translation table and only texts missing from it are sent
+# to the backend. Corpus sentences are translated over and over, so most requests never
+# reach it. An empty source means the backend detected the language.
+class Translator:
+
+    @cached_property
+    def config(self):
+        return {**DEFAULT_TRANSLATION, **getattr(settings, "TRANSLATION", {})}
+
+    @cached_property
+    def backend(self):
+        return import_string(self.config["BACKEND"])(**self.config["OPTIONS"])
+
+    @cached_property
+    def dispatcher(self):
+        return TranslationDispatcher(self.backend, window=self.config["BATCH_WINDOW"],
+                                     max_batch=self.config["MAX_BATCH"],
+                                     max_concurrency=self.config["MAX_CONCURRENCY"], timeout=self.config["TIMEOUT"])
+
+    def translate(self, texts, target, source=None, found=None):
+        # found: what cached() returned for these texts, if already looked up
+        found = dict(found) if found is not None else self.cached(texts, target, source)
+        missing = list(dict.fromkeys(text for text in texts if text not in found))
+        if missing:
+            try:
+                translated = dict(zip(missing, self.dispatcher.translate(missing, target, source)))
+            except TimeoutError:
+                raise TranslationUnavailable()
+            self.store(translated, target, source)
+            found.update(translated)
+        return [found[text] for text in texts]
+
+    @staticmethod
+    def cached(texts, target, source=None):
+        hashes = {text_hash(text): text for text in texts}
+        stored = Translation.objects.filter(source__exact=source or "", target__exact=target,
+                                            text_hash__in=list(hashes)).values_list("text_hash", "translation")
+        return {hashes[h]: translation for h, translation in stored}
+
+    @staticmethod
+    def store(translations, target, source=None):
+        entries = [Translation(text_hash=text_hash(text), source=source or "", target=target, translation=translation)
+                   for text, translation in translations.items()]
+        # Another request may have stored some of them first
+        Translation.objects.bulk_create(entries, ignore_conflicts=True)
+
+
+translator = Translator()
@@ -1,7 +1,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import index, SentenceDetailView, SentenceFormsView, SentenceListView, SentenceReportView, SentenceTranslateView, UserViewSet
+from .views import index, SentenceBatchView, SentenceDetailView, SentenceFormsView, SentenceListView, SentenceReportView, SentenceTranslateView, TaggerMetricsView, UserViewSet
 
 router = DefaultRouter()
 router.register('user', UserViewSet)
@@ -14,7 +14,9 @@ urlpatterns = [
     path('users/', UserViewSet.as_view({'get': 'list', 'post': 'create'}), name='create-user'),
     path('report/', SentenceReportView.as_view(), name='report'),
     path('forms/<str:language>/<str:word>/', SentenceFormsView.as_view(), name='sentence-forms'),
+    path('sentences/<str:language>/', SentenceBatchView.as_view(), name='sentence-batch'),
     path('sentences/<str:language>/<str:word>/', SentenceListView.as_view(), name='sentence-list'),
     path('translate/', SentenceTranslateView.as_view(), name='sentence-translate'),
-    path('<str:pk>/', SentenceDetailView.as_view(), name='sentence-detail'),
+    path('metrics/taggers/', TaggerMetricsView.as_view(), name='tagger-metrics'),
+    path('<uuid:ref_id>/', SentenceDetailView.as_view(), name='sentence-detail'),
 ]
@@ -1,3 +1,8 @@
+import re
+
+# Words of a sentence, as matched by the \b(word)\b searches
+TOKEN_RE = re.compile(r"\w+")
+
 
 def wordtype2group(word_type):
     if "Verb" in word_type:
@@ -9,3 +14,24 @@ def wordtype2group(word_type):
     if "Unk" in word_type:
         return "unk"
     return "misc"
+
+
+# Start offsets of the occurrences of each token, by token
+def sentence_tokens(content):
+    tokens = {}
+    for match in TOKEN_RE.finditer(content):
+        tokens.setdefault(match.group(), []).append(match.start())
+    return tokens
+
+
+def format_positions(positions):
+    return ",".join(map(str, positions))
+
+
+# (start, end) of each occurrence of token, from SentenceToken.positions
+def token_spans(token, positions):
+    return [(start, start + len(token)) for start in map(int, positions.split(","))] if positions else []
+
+
+def is_single_token(word):
+    return TOKEN_RE.fullmatch(word) is not None
@@ -1,33 +1,43 @@
-import itertools
+import re
+import uuid
 from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import CharField, F, TextField, Value
 from django.http import HttpResponse
-from google.cloud import translate_v2 as translate
 from rest_framework import permissions, viewsets
 from rest_framework.decorators import api_view
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from .corpus import active_generations
+from .detail import sentence_cache
 from .fields import Category
+from .forms import forms_cache
 from .models import Sentence
-from .nlp import NLP
-from .serializers import UserSerializer, SentenceSerializer
-from .utils import wordtype2group
+from .nlp import build_difficulty_filter, nlp_pool
+from .nlp.cache import tag_cache
+from .nlp.tagger_poll import tagger_poll
+from .reports import MAX_REPORTS, report_buffer
+from .serializers import UserSerializer, SentenceSerializer, SentenceBatchSerializer, SentenceFilterSerializer, \
+    TranslationSerializer
+from .utils import is_single_token, token_spans
 from .throttles import BurstRateThrottle, GCloudThrottle
+from .translation import translator
 
 
 class SentenceListMixin:
 
     @staticmethod
-    def get_categories(request):
-        category = request.query_params.get('category', None)
+    def get_categories(category):
         categories = [category] if category else [Category.NEWS, Category.WEB]
         return categories
 
     @staticmethod
     def get_min_max_score(request, language, categories):
-        nlp = NLP(language)
         difficulty = int(request.query_params.get('difficulty', -1))
-        return nlp.get_min_max_score(difficulty, categories)
+        with nlp_pool.acquire(language) as nlp:
+            return nlp.get_min_max_score(difficulty, categories)
 
 
 class SentenceFormsView(SentenceListMixin, APIView):
@@ -35,32 +45,7 @@ class SentenceFormsView(SentenceListMixin, APIView):
     throttle_classes = [BurstRateThrottle]
 
     def get(self, request, language, word):
-        nlp = NLP(language)
-        response = {"forms": []}
-        form_objs = []
-        if not nlp.is_noun(word):
-            word = word.lower()
-        response["search_term"] = self.make_form_obj(word, nlp, initial=True, search_group=request.GET.get("group"))
-        word_forms = nlp.get_word_forms(word, search_group=request.GET.get("group"))
-        if request.GET.get("group") is not None:
-            search_form_group = request.GET.get("group")
-        else:
-            search_form_group = response["search_term"]["group"]
-        for w in word_forms:
-            form_objs.append(self.make_form_obj(w, nlp, search_group=search_form_group))
-        forms = sorted([f for f in form_objs if f["group"] == search_form_group], key=lambda k: k["word_type"])
-        response["possible_groups"] = nlp.possible_groups()
-        response["forms"] = [{
-            "word_type": key,
-            "group": wordtype2group(key),
-            "results": list(group)} for (key, group) in itertools.groupby(forms, key=lambda k: k["word_type"])
-        ]
-        return Response(response)
-
-    @staticmethod
-    def make_form_obj(word, nlp, search_group=None, initial=False):
-        typ, group, pos = nlp.get_pos_tag(word, search_group, initial)
-        return {"word": word, "pos": pos, "word_type": typ, "group": group}
+        return Response(forms_cache.get_or_build(language, word, request.GET.get("group")))
 
 
 class SentenceListView(SentenceListMixin, APIView):
@@ -68,23 +53,95 @@ class SentenceListView(SentenceListMixin, APIView):
     throttle_classes = [BurstRateThrottle]
 
     def get(self, request, language, word):
-        nlp = NLP(language)
-        categories = self.get_categories(request)
-        difficulty = int(request.GET.get("difficulty")) if request.GET.get("difficulty") else None
-        sentences = Sentence.objects.filter(
-            content__regex=r"\b(" + word + r")\b",
-            **nlp.build_difficulty_filter(difficulty),
-            reports__lte=3,
-            language__exact=language,
-            category__in=categories
-        )[:5]
+        serializer = SentenceFilterSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        categories = self.get_categories(data.get("category"))
+        difficulty_filter = build_difficulty_filter(data.get("difficulty"))
+        sentences = self.search_sentences(language, word, categories, difficulty_filter)[:5]
         sentences_list = [{
             "word": word,
             "sentence": s.content,
+            "spans": self.match_spans(word, s),
             "id": s.ref_id,
             "category": s.category} for s in sentences]
         return Response({"sentences": sentences_list})
 
+    @staticmethod
+    def search_sentences(language, word, categories, difficulty_filter):
+        sentences = Sentence.objects.filter(
+            **difficulty_filter,
+            reports__lte=MAX_REPORTS,
+            language__exact=language,
+            category__in=categories,
+            generation__in=active_generations(language, categories)
+        )
+        # Single words are looked up in the token index, which also has their offsets.
+        # Anything else is still matched.
+        if is_single_token(word):
+            return sentences.filter(tokens__language__exact=language, tokens__token__exact=word) \
+                .annotate(positions=F("tokens__positions"))
+        return sentences.filter(content__regex=r"\b(" + re.escape(word) + r")\b") \
+            .annotate(positions=Value(None, output_field=TextField()))
+
+    @staticmethod
+    def match_spans(word, sentence):
+        # [start, end) character offsets of the word in the sentence
+        if sentence.positions is not None:
+            return token_spans(word, sentence.positions)
+        return [match.span() for match in re.finditer(r"\b(" + re.escape(word) + r")\b", sentence.content)]
+
+
+# Sentences of every form of a word in one request, grouped by form. Single-word forms are
+# answered by one query on the token index.
+class SentenceBatchView(SentenceListMixin, GenericAPIView):
+    serializer_class = SentenceBatchSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = [BurstRateThrottle]
+    per_form = 5
+
+    def post(self, request, language):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        forms = list(dict.fromkeys(data["forms"]))
+        categories = self.get_categories(data.get("category"))
+        difficulty_filter = build_difficulty_filter(data.get("difficulty"))
+        tokens = [form for form in forms if is_single_token(form)]
+        results = self.search_tokens(language, tokens, categories, difficulty_filter)
+        for form in forms:
+            if form not in results:
+                sentences = SentenceListView.search_sentences(language, form, categories, difficulty_filter)
+                results[form] = [self.sentence_obj(form, s.content, SentenceListView.match_spans(form, s),
+                                                   s.ref_id, s.category) for s in sentences[:self.per_form]]
+        return Response({"sentences": {form: results[form] for form in forms}})
+
+    def search_tokens(self, language, tokens, categories, difficulty_filter):
+        results = {token: [] for token in tokens}
+        if not tokens:
+            return results
+        # The five sentences of each form, each scan stopping at its LIMIT, in one statement.
+        # Django won't slice the parts of a union on SQLite, so they are wrapped around here.
+        parts = [SentenceListView.search_sentences(language, token, categories, difficulty_filter)
+                 .annotate(form=Value(token, output_field=CharField()))
+                 .values("content", "ref_id", "category", "form", "positions")[:self.per_form].query
+                 .sql_with_params() for token in tokens]
+        sql = " UNION ALL ".join(f"SELECT * FROM ({part}) form_{i}" for i, (part, _) in enumerate(parts))
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [param for _, params in parts for param in params])
+            columns = [column[0] for column in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        ref_id_field = Sentence._meta.get_field("ref_id")
+        for row in rows:
+            results[row["form"]].append(self.sentence_obj(row["form"], row["content"],
+                                                          token_spans(row["form"], row["positions"]),
+                                                          ref_id_field.to_python(row["ref_id"]), row["category"]))
+        return results
+
+    @staticmethod
+    def sentence_obj(form, content, spans, ref_id, category):
+        return {"word": form, "sentence": content, "spans": spans, "id": ref_id, "category": category}
+
 
 class SentenceDetailView(GenericAPIView):
     serializer_class = SentenceSerializer
@@ -92,12 +149,10 @@ class SentenceDetailView(GenericAPIView):
     throttle_classes = [BurstRateThrottle]
 
     def get(self, request, ref_id):
-        sentence = self.get_object(ref_id)
-        serializer = SentenceSerializer(sentence)
-        return Response(serializer.data)
-
-    def get_object(self, ref_id):
-        return Sentence.objects.get(ref_id=ref_id)
+        try:
+            return Response(sentence_cache.get(ref_id))
+        except Sentence.DoesNotExist:
+            raise NotFound()
 
 
 class SentenceReportView(GenericAPIView):
@@ -106,24 +161,47 @@ class SentenceReportView(GenericAPIView):
     throttle_classes = [BurstRateThrottle]
 
     def post(self, request):
-        s_id = request.data["id"]
-        s = Sentence.objects.get(ref_id=s_id)
-        s.reports += 1
-        s.save()
+        try:
+            ref_id = uuid.UUID(str(request.data["id"]))
+        except (KeyError, ValueError):
+            raise ValidationError({"id": "Expected a sentence id."})
+        if not Sentence.objects.filter(ref_id=ref_id).exists():
+            raise NotFound()
+        report_buffer.add(ref_id)
         return HttpResponse(status=204)
 
 
-# Throttled wrapper around the Google Translate API
+# Throttled wrapper around the translation backend, see sentences.translation
 class SentenceTranslateView(GenericAPIView):
-    translate_client = translate.Client()
+    serializer_class = TranslationSerializer
     permission_classes = [permissions.IsAuthenticated]
     throttle_classes = [GCloudThrottle]
 
     def post(self, request):
-        sentence = request.data["sentence"]
-        target_lang = request.data["target_lang"]
-        result = self.translate_client.translate(sentence, target_language=target_lang)
-        return Response({"translation": result["translatedText"]})
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        sentence = data["sentence"]
+        translation, = translator.translate([sentence], data["target_lang"], data.get("source_lang"),
+                                            found=self.stored_translations(request))
+        return Response({"translation": translation})
+
+    def stored_translations(self, request):
+        # Looked up once per request, first by GCloudThrottle. Empty for invalid data.
+        if not hasattr(self, "stored"):
+            self.stored = {}
+            serializer = self.get_serializer(data=request.data)
+            if serializer.is_valid():
+                data = serializer.validated_data
+                self.stored = translator.cached([data["sentence"]], data["target_lang"], data.get("source_lang"))
+        return self.stored
+
+
+class TaggerMetricsView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response({"taggers": tagger_poll.metrics(), "tag_cache": tag_cache.stats()})
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -35,6 +35,78 @@ os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = env("GOOGLE_APPLICATION_CREDENTIA
 # TreeTagger location
 os.environ["TAGDIR"] = env("TAGDIR")
 
+# pattern.<lang> lexicons loaded at startup (see sentences.nlp.pattern_registry), e.g.
+# ["de", "en"]. Under gunicorn --preload they are then shared by the forked workers.
+PATTERN_PREWARM = []
+# NLP instances kept per language (see sentences.nlp.pool)
+NLP_POOL_SIZE = 4
+# Seconds to wait for a free NLP instance when the pool is exhausted
+NLP_POOL_TIMEOUT = 30
+# Tree-tagger processes per language, resized from load (see sentences.nlp.tagger_poll)
+TAGGER_POLL = {
+    "LANGUAGES": ["de", "en", "es", "fr", "it", "nl"],
+    "MIN_SPARES": 1,
+    "MAX_SIZE": 4,
+    "IDLE_TIMEOUT": 300,
+    "SCALE_UP_WAIT": 0.05,
+    "MULTIPLEX_DEPTH": 8,
+    "INTERVAL": 5,
+}
+# Pipeline concurrent texts through each tagger process instead of checking taggers out
+TAGGER_MULTIPLEX = False
+# Cache of TreeTagger probabilities per (language, token), see sentences.nlp.cache
+TAG_CACHE = {
+    "MAX_SIZE": 50000,
+    "TTL": None,
+    "SHARED_CACHE": None,
+}
+
+# Responses of the word forms view, keyed by resource versions (see sentences.forms).
+# Stored in the forms_cache table by default, so entries are shared between workers and
+# kept across restarts without another service; fill it ahead with manage.py
+# warm_forms_cache. None disables the cache.
+FORMS_CACHE = "forms"
+
+# Reports are counted in memory and written in batches (see sentences.reports)
+REPORT_BUFFER = {
+    "FLUSH_INTERVAL": 5,
+    "MAX_PENDING": 1000,
+}
+# Backend of the translate view (see sentences.translation), which only sees texts that
+# are not in the Translation table yet. FakeBackend translates offline. Requests arriving
+# while calls are in flight are sent together after at most BATCH_WINDOW seconds, with at
+# most MAX_CONCURRENCY calls at once.
+TRANSLATION = {
+    "BACKEND": "sentences.translation.backends.GoogleBackend",
+    "OPTIONS": {},
+    "BATCH_WINDOW": 0.01,
+    "MAX_BATCH": 50,
+    "MAX_CONCURRENCY": 4,
+    "TIMEOUT": 30,
+}
+# Sentence details by ref_id (see sentences.detail), None disables the cache
+SENTENCE_CACHE = "sentences"
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Created by migrate (sentences 0015) or manage.py createcachetable. One entry per
+    # language, word and group, sized for ~20000 looked up words in each of 6 languages.
+    "forms": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "forms_cache",
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": 120000},
+    },
+    "sentences": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "sentences",
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+}
+
 MAINTENANCE_MODE = None if env("MAINTENANCE_MODE") == "None" else True
 
 SECURE_REFERRER_POLICY = "same-origin"